@@ -3,152 +3,202 @@ Conference history and predecessor mappings for comprehensive historical testing
 Tracks conference name changes, mergers, and splits over the past 15 years (2009-2024).
 """
 
-from typing import Dict, List, Tuple, Optional
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, NamedTuple, Tuple, Optional
 
-# Conference history mappings: current_name -> [(year_range, venue_key, venue_short)]
-CONFERENCE_HISTORY = {
+
+class HistEntry(NamedTuple):
+    """A span of years during which a conference used one DBLP/anthology venue."""
+    start: int
+    end: int
+    venue_key: str
+    venue_short: str
+
+
+# Conference history mappings: current_name -> (HistEntry(start, end, venue_key, venue_short), ...)
+# The history tables are static, so they are frozen all the way down (read-only
+# mappings of tuples); the lookup tables built from them can never go stale
+CONFERENCE_HISTORY: Mapping[str, Tuple[HistEntry, ...]] = MappingProxyType({
     # Software Engineering Conferences
-    'SANER': [
+    'SANER': (
         # SANER started in 2015, before that it was CSMR and WCRE
-        (2015, 2024, 'conf/wcre', 'saner'),      # SANER (2015-present)
-    ],
+        HistEntry(2015, 2024, 'conf/wcre', 'saner'),      # SANER (2015-present)
+    ),
     
-    'ICSME': [
+    'ICSME': (
         # ICSME started in 2014, before that it was ICSM
-        (2014, 2024, 'conf/icsm', 'icsme'),     # ICSME (2014-present)
-    ],
+        HistEntry(2014, 2024, 'conf/icsm', 'icsme'),     # ICSME (2014-present)
+    ),
     
-    'ICPC': [
+    'ICPC': (
         # ICPC was always ICPC but had different venue keys in DBLP
-        (2009, 2024, 'conf/iwpc', 'icpc'),      # Always ICPC, but DBLP uses IWPC
-    ],
+        HistEntry(2009, 2024, 'conf/iwpc', 'icpc'),      # Always ICPC, but DBLP uses IWPC
+    ),
     
-    'ASE': [
+    'ASE': (
         # ASE was always ASE but had venue key changes
-        (2009, 2024, 'conf/kbse', 'ase'),       # ASE (DBLP uses KBSE - Knowledge-Based Software Engineering)
-    ],
+        HistEntry(2009, 2024, 'conf/kbse', 'ase'),       # ASE (DBLP uses KBSE - Knowledge-Based Software Engineering)
+    ),
     
-    'FSE': [
+    'FSE': (
         # FSE was ESEC/FSE in some years
-        (2009, 2024, 'conf/sigsoft', 'fse'),    # FSE/ESEC-FSE
-    ],
+        HistEntry(2009, 2024, 'conf/sigsoft', 'fse'),    # FSE/ESEC-FSE
+    ),
     
-    'ICSE': [
-        (2009, 2024, 'conf/icse', 'icse'),      # ICSE has been consistent
-    ],
+    'ICSE': (
+        HistEntry(2009, 2024, 'conf/icse', 'icse'),      # ICSE has been consistent
+    ),
     
-    'ISSTA': [
-        (2009, 2024, 'conf/issta', 'issta'),    # ISSTA has been consistent
-    ],
+    'ISSTA': (
+        HistEntry(2009, 2024, 'conf/issta', 'issta'),    # ISSTA has been consistent
+    ),
     
-    'MSR': [
-        (2009, 2024, 'conf/msr', 'msr'),        # MSR started in 2004, consistent since
-    ],
+    'MSR': (
+        HistEntry(2009, 2024, 'conf/msr', 'msr'),        # MSR started in 2004, consistent since
+    ),
     
-    'ICSA': [
+    'ICSA': (
         # ICSA started in 2017, before that it was WICSA/QoSA/CompArch
-        (2017, 2024, 'conf/icsa', 'icsa'),      # ICSA (2017-present)
-    ],
+        HistEntry(2017, 2024, 'conf/icsa', 'icsa'),      # ICSA (2017-present)
+    ),
     
-    'ECSA': [
-        (2009, 2024, 'conf/ecsa', 'ecsa'),      # ECSA has been consistent since 2007
-    ],
+    'ECSA': (
+        HistEntry(2009, 2024, 'conf/ecsa', 'ecsa'),      # ECSA has been consistent since 2007
+    ),
     
-    'OOPSLA': [
-        (2009, 2024, 'conf/oopsla', 'oopsla'),  # OOPSLA has been consistent
-    ],
+    'OOPSLA': (
+        HistEntry(2009, 2024, 'conf/oopsla', 'oopsla'),  # OOPSLA has been consistent
+    ),
     
-    'RE': [
-        (2009, 2024, 'conf/re', 're'),          # RE has been consistent
-    ],
+    'RE': (
+        HistEntry(2009, 2024, 'conf/re', 're'),          # RE has been consistent
+    ),
     
-    'ISSRE': [
-        (2009, 2024, 'conf/issre', 'issre'),    # ISSRE has been consistent
-    ],
+    'ISSRE': (
+        HistEntry(2009, 2024, 'conf/issre', 'issre'),    # ISSRE has been consistent
+    ),
     
     # AI/ML Conferences
-    'ICML': [
-        (2009, 2024, 'conf/icml', 'icml'),      # ICML has been consistent
-    ],
+    'ICML': (
+        HistEntry(2009, 2024, 'conf/icml', 'icml'),      # ICML has been consistent
+    ),
     
-    'NIPS': [
+    'NIPS': (
         # NeurIPS was called NIPS until 2017, but uses same venue
-        (2009, 2024, 'conf/nips', 'neurips'),   # NIPS/NeurIPS (uses neurips in DBLP)
-    ],
+        HistEntry(2009, 2024, 'conf/nips', 'neurips'),   # NIPS/NeurIPS (uses neurips in DBLP)
+    ),
     
-    'ICLR': [
+    'ICLR': (
         # ICLR started in 2013
-        (2013, 2024, 'conf/iclr', 'iclr'),      # ICLR (2013-present)
-    ],
+        HistEntry(2013, 2024, 'conf/iclr', 'iclr'),      # ICLR (2013-present)
+    ),
     
-    'AAAI': [
-        (2009, 2024, 'conf/aaai', 'aaai'),      # AAAI has been consistent
-    ],
+    'AAAI': (
+        HistEntry(2009, 2024, 'conf/aaai', 'aaai'),      # AAAI has been consistent
+    ),
     
-    'IJCAI': [
-        (2009, 2024, 'conf/ijcai', 'ijcai'),    # IJCAI has been consistent
-    ],
+    'IJCAI': (
+        HistEntry(2009, 2024, 'conf/ijcai', 'ijcai'),    # IJCAI has been consistent
+    ),
     
     # NLP Conferences
-    'ACL': [
-        (2009, 2024, 'venues/acl', 'acl'),      # ACL has been consistent
-    ],
+    'ACL': (
+        HistEntry(2009, 2024, 'venues/acl', 'acl'),      # ACL has been consistent
+    ),
     
-    'EMNLP': [
-        (2009, 2024, 'venues/emnlp', 'emnlp'),  # EMNLP has been consistent
-    ],
+    'EMNLP': (
+        HistEntry(2009, 2024, 'venues/emnlp', 'emnlp'),  # EMNLP has been consistent
+    ),
     
-    'NAACL': [
+    'NAACL': (
         # NAACL happens every 2-3 years
-        (2009, 2024, 'venues/naacl', 'naacl'),  # NAACL (not every year)
-    ],
+        HistEntry(2009, 2024, 'venues/naacl', 'naacl'),  # NAACL (not every year)
+    ),
     
-    'COLING': [
+    'COLING': (
         # COLING happens every 2 years
-        (2009, 2024, 'venues/coling', 'coling'), # COLING (every 2 years)
-    ],
-}
+        HistEntry(2009, 2024, 'venues/coling', 'coling'), # COLING (every 2 years)
+    ),
+})
 
 # Years when conferences didn't happen or had different names
-CONFERENCE_GAPS = {
-    'ICLR': [2009, 2010, 2011, 2012],  # ICLR started in 2013
-    'SANER': [2009, 2010, 2011, 2012, 2013, 2014],  # SANER started in 2015
-    'ICSME': [2009, 2010, 2011, 2012, 2013],  # ICSME started in 2014
-    'ICSA': [2009, 2010, 2011, 2012, 2013, 2014, 2015, 2016],  # ICSA started in 2017
-    'NAACL': [2011, 2014, 2017, 2020, 2023],  # NAACL skipped years (approximate)
-    'COLING': [2009, 2011, 2013, 2015, 2017, 2019, 2021, 2023],  # COLING every 2 years
-}
+# (frozensets, since gap years are only ever used for membership tests)
+CONFERENCE_GAPS: Mapping[str, FrozenSet[int]] = MappingProxyType({
+    'ICLR': frozenset({2009, 2010, 2011, 2012}),  # ICLR started in 2013
+    'SANER': frozenset({2009, 2010, 2011, 2012, 2013, 2014}),  # SANER started in 2015
+    'ICSME': frozenset({2009, 2010, 2011, 2012, 2013}),  # ICSME started in 2014
+    'ICSA': frozenset({2009, 2010, 2011, 2012, 2013, 2014, 2015, 2016}),  # ICSA started in 2017
+    'NAACL': frozenset({2011, 2014, 2017, 2020, 2023}),  # NAACL skipped years (approximate)
+    'COLING': frozenset({2009, 2011, 2013, 2015, 2017, 2019, 2021, 2023}),  # COLING every 2 years
+})
+
+# Predecessor conference short names (DBLP venue names) for renamed conferences
+PREDECESSORS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'SANER': ('wcre', 'csmr'),  # SANER merged WCRE and CSMR in 2015
+    'ICSME': ('icsm',),  # ICSME was ICSM until 2013
+    'ICSA': ('wicsa',),  # ICSA succeeded WICSA in 2017
+})
 
 # Expected minimum paper counts by year range (accounting for conference growth)
-HISTORICAL_MIN_PAPERS = {
+HISTORICAL_MIN_PAPERS: Mapping[str, Mapping[Tuple[int, int], int]] = MappingProxyType({
     # SE Conferences
-    'ICSE': {(2009, 2014): 80, (2015, 2019): 100, (2020, 2024): 120},
-    'FSE': {(2009, 2014): 60, (2015, 2019): 80, (2020, 2024): 100},
-    'ASE': {(2009, 2014): 40, (2015, 2019): 60, (2020, 2024): 80},
-    'ISSTA': {(2009, 2014): 15, (2015, 2019): 20, (2020, 2024): 25},
-    'MSR': {(2009, 2014): 15, (2015, 2019): 25, (2020, 2024): 30},
-    'ICPC': {(2009, 2014): 10, (2015, 2019): 15, (2020, 2024): 20},
-    'ICSME': {(2009, 2014): 25, (2015, 2019): 35, (2020, 2024): 45},
-    'SANER': {(2009, 2014): 20, (2015, 2019): 30, (2020, 2024): 40},
-    'ICSA': {(2009, 2014): 8, (2015, 2019): 12, (2020, 2024): 15},
-    'ECSA': {(2009, 2014): 8, (2015, 2019): 12, (2020, 2024): 15},
-    'OOPSLA': {(2009, 2014): 25, (2015, 2019): 35, (2020, 2024): 45},
-    'RE': {(2009, 2014): 15, (2015, 2019): 20, (2020, 2024): 25},
-    'ISSRE': {(2009, 2014): 10, (2015, 2019): 15, (2020, 2024): 20},
+    'ICSE': MappingProxyType({(2009, 2014): 80, (2015, 2019): 100, (2020, 2024): 120}),
+    'FSE': MappingProxyType({(2009, 2014): 60, (2015, 2019): 80, (2020, 2024): 100}),
+    'ASE': MappingProxyType({(2009, 2014): 40, (2015, 2019): 60, (2020, 2024): 80}),
+    'ISSTA': MappingProxyType({(2009, 2014): 15, (2015, 2019): 20, (2020, 2024): 25}),
+    'MSR': MappingProxyType({(2009, 2014): 15, (2015, 2019): 25, (2020, 2024): 30}),
+    'ICPC': MappingProxyType({(2009, 2014): 10, (2015, 2019): 15, (2020, 2024): 20}),
+    'ICSME': MappingProxyType({(2009, 2014): 25, (2015, 2019): 35, (2020, 2024): 45}),
+    'SANER': MappingProxyType({(2009, 2014): 20, (2015, 2019): 30, (2020, 2024): 40}),
+    'ICSA': MappingProxyType({(2009, 2014): 8, (2015, 2019): 12, (2020, 2024): 15}),
+    'ECSA': MappingProxyType({(2009, 2014): 8, (2015, 2019): 12, (2020, 2024): 15}),
+    'OOPSLA': MappingProxyType({(2009, 2014): 25, (2015, 2019): 35, (2020, 2024): 45}),
+    'RE': MappingProxyType({(2009, 2014): 15, (2015, 2019): 20, (2020, 2024): 25}),
+    'ISSRE': MappingProxyType({(2009, 2014): 10, (2015, 2019): 15, (2020, 2024): 20}),
     
     # AI/ML Conferences  
-    'ICML': {(2009, 2014): 200, (2015, 2019): 400, (2020, 2024): 800},
-    'NIPS': {(2009, 2014): 300, (2015, 2019): 600, (2020, 2024): 1200},
-    'ICLR': {(2013, 2016): 100, (2017, 2019): 300, (2020, 2024): 600},
-    'AAAI': {(2009, 2014): 200, (2015, 2019): 400, (2020, 2024): 800},
-    'IJCAI': {(2009, 2014): 150, (2015, 2019): 250, (2020, 2024): 400},
+    'ICML': MappingProxyType({(2009, 2014): 200, (2015, 2019): 400, (2020, 2024): 800}),
+    'NIPS': MappingProxyType({(2009, 2014): 300, (2015, 2019): 600, (2020, 2024): 1200}),
+    'ICLR': MappingProxyType({(2013, 2016): 100, (2017, 2019): 300, (2020, 2024): 600}),
+    'AAAI': MappingProxyType({(2009, 2014): 200, (2015, 2019): 400, (2020, 2024): 800}),
+    'IJCAI': MappingProxyType({(2009, 2014): 150, (2015, 2019): 250, (2020, 2024): 400}),
     
     # NLP Conferences
-    'ACL': {(2009, 2014): 150, (2015, 2019): 250, (2020, 2024): 400},
-    'EMNLP': {(2009, 2014): 150, (2015, 2019): 250, (2020, 2024): 400},
-    'NAACL': {(2009, 2014): 80, (2015, 2019): 120, (2020, 2024): 200},
-    'COLING': {(2009, 2014): 150, (2015, 2019): 200, (2020, 2024): 300},
-}
+    'ACL': MappingProxyType({(2009, 2014): 150, (2015, 2019): 250, (2020, 2024): 400}),
+    'EMNLP': MappingProxyType({(2009, 2014): 150, (2015, 2019): 250, (2020, 2024): 400}),
+    'NAACL': MappingProxyType({(2009, 2014): 80, (2015, 2019): 120, (2020, 2024): 200}),
+    'COLING': MappingProxyType({(2009, 2014): 150, (2015, 2019): 200, (2020, 2024): 300}),
+})
+
+
+def _build_venue_table() -> Dict[Tuple[str, int], Tuple[str, str]]:
+    """Flatten CONFERENCE_HISTORY ranges into a (conference, year) lookup table."""
+    table = {}
+    for conference, history in CONFERENCE_HISTORY.items():
+        for entry in history:
+            for year in range(entry.start, entry.end + 1):
+                # First matching range wins, as with the original range scan
+                table.setdefault((conference, year), (entry.venue_key, entry.venue_short))
+    return table
+
+
+def _build_min_papers_table() -> Dict[Tuple[str, int], int]:
+    """Flatten HISTORICAL_MIN_PAPERS ranges into a (conference, year) lookup table."""
+    table = {}
+    for conference, ranges in HISTORICAL_MIN_PAPERS.items():
+        for (start_year, end_year), min_papers in ranges.items():
+            for year in range(start_year, end_year + 1):
+                table.setdefault((conference, year), min_papers)
+    return table
+
+
+# Precomputed at import so lookups are a single dict hit instead of a range scan
+_VENUE_BY_YEAR = _build_venue_table()
+_MIN_PAPERS_BY_YEAR = _build_min_papers_table()
+
+# Membership set for "is this a tracked conference?" checks
+ALL_CONFERENCES_SET: FrozenSet[str] = frozenset(CONFERENCE_HISTORY.keys())
+_ALL_CONFERENCES: Tuple[str, ...] = tuple(CONFERENCE_HISTORY)
 
 
 def get_venue_for_year(conference: str, year: int) -> Tuple[str, str]:
@@ -162,15 +212,14 @@ def get_venue_for_year(conference: str, year: int) -> Tuple[str, str]:
     Returns:
         Tuple of (venue_key, venue_short) for that year
     """
+    try:
+        return _VENUE_BY_YEAR[(conference, year)]
+    except KeyError:
+        pass
+    
     if conference not in CONFERENCE_HISTORY:
         raise ValueError(f"Conference {conference} not found in history")
     
-    history = CONFERENCE_HISTORY[conference]
-    
-    for start_year, end_year, venue_key, venue_short in history:
-        if start_year <= year <= end_year:
-            return venue_key, venue_short
-    
     raise ValueError(f"No venue mapping found for {conference} in year {year}")
 
 
@@ -185,16 +234,7 @@ def get_expected_min_papers(conference: str, year: int) -> int:
     Returns:
         Expected minimum number of papers
     """
-    if conference not in HISTORICAL_MIN_PAPERS:
-        return 5  # Default minimum
-    
-    ranges = HISTORICAL_MIN_PAPERS[conference]
-    
-    for (start_year, end_year), min_papers in ranges.items():
-        if start_year <= year <= end_year:
-            return min_papers
-    
-    return 5  # Default minimum
+    return _MIN_PAPERS_BY_YEAR.get((conference, year), 5)  # Default minimum
 
 
 def conference_exists_in_year(conference: str, year: int) -> bool:
@@ -209,26 +249,21 @@ def conference_exists_in_year(conference: str, year: int) -> bool:
         True if conference happened in that year
     """
     # Check if conference is in gaps (didn't happen that year)
-    if conference in CONFERENCE_GAPS:
-        if year in CONFERENCE_GAPS[conference]:
-            return False
+    if year in CONFERENCE_GAPS.get(conference, ()):
+        return False
     
     # Check if conference existed at all in that year
-    try:
-        get_venue_for_year(conference, year)
-        return True
-    except ValueError:
-        return False
+    return (conference, year) in _VENUE_BY_YEAR
 
 
-def get_all_test_years() -> List[int]:
+def get_all_test_years() -> range:
     """Get all years for comprehensive testing (2009-2024)."""
-    return list(range(2009, 2025))
+    return range(2009, 2025)
 
 
 def get_all_conferences() -> List[str]:
     """Get all conference names."""
-    return list(CONFERENCE_HISTORY.keys())
+    return list(_ALL_CONFERENCES)
 
 
 def get_predecessor_conferences(conference: str) -> List[str]:
@@ -241,13 +276,4 @@ def get_predecessor_conferences(conference: str) -> List[str]:
     Returns:
         List of predecessor conference short names
     """
-    predecessors = []
-    
-    if conference == 'SANER':
-        predecessors = ['wcre', 'csmr']
-    elif conference == 'ICSME':
-        predecessors = ['icsm']
-    elif conference == 'ICSA':
-        predecessors = ['wicsa']
-    
-    return predecessors
\ No newline at end of file
+    return list(PREDECESSORS.get(conference, ()))
\ No newline at end of file
@@ -2,6 +2,9 @@
 Configuration for top conferences in SE, AI/ML, and NLP fields.
 """
 
+from pathlib import Path
+from types import MappingProxyType
+
 CONFERENCES = {
     # Software Engineering (A* conferences)
     'SE': {
@@ -10,7 +13,6 @@ CONFERENCES = {
             'base_url': 'https://conf.researchr.org/series/icse',
             'type': 'dblp',
             'venue_key': 'conf/icse',
-            'venue_path': 'conf/icse',
             'venue_short': 'icse'
         },
         'FSE': {
@@ -18,7 +20,6 @@ CONFERENCES = {
             'base_url': 'https://conf.researchr.org/series/fse',
             'type': 'dblp',
             'venue_key': 'conf/sigsoft',
-            'venue_path': 'conf/sigsoft',
             'venue_short': 'fse'
         },
         'ASE': {
@@ -26,7 +27,6 @@ CONFERENCES = {
             'base_url': 'https://conf.researchr.org/series/ase',
             'type': 'dblp',
             'venue_key': 'conf/kbse',
-            'venue_path': 'conf/kbse',
             'venue_short': 'ase'
         },
         'ISSTA': {
@@ -34,7 +34,6 @@ CONFERENCES = {
             'base_url': 'https://conf.researchr.org/series/issta',
             'type': 'dblp',
             'venue_key': 'conf/issta',
-            'venue_path': 'conf/issta',
             'venue_short': 'issta'
         },
         'ICSA': {
@@ -42,7 +41,6 @@ CONFERENCES = {
             'base_url': 'https://conf.researchr.org/series/icsa',
             'type': 'dblp',
             'venue_key': 'conf/icsa',
-            'venue_path': 'conf/icsa',
             'venue_short': 'icsa'
         },
         'MSR': {
@@ -50,7 +48,6 @@ CONFERENCES = {
             'base_url': 'https://conf.researchr.org/series/msr',
             'type': 'dblp',
             'venue_key': 'conf/msr',
-            'venue_path': 'conf/msr',
             'venue_short': 'msr'
         },
         'ICPC': {
@@ -58,7 +55,6 @@ CONFERENCES = {
             'base_url': 'https://conf.researchr.org/series/icpc',
             'type': 'dblp',
             'venue_key': 'conf/iwpc',
-            'venue_path': 'conf/iwpc',
             'venue_short': 'icpc'
         },
         'ICSME': {
@@ -66,7 +62,6 @@ CONFERENCES = {
             'base_url': 'https://conf.researchr.org/series/icsme',
             'type': 'dblp',
             'venue_key': 'conf/icsm',
-            'venue_path': 'conf/icsm',
             'venue_short': 'icsme'
         },
         'SANER': {
@@ -74,7 +69,6 @@ CONFERENCES = {
             'base_url': 'https://conf.researchr.org/series/saner',
             'type': 'dblp',
             'venue_key': 'conf/wcre',
-            'venue_path': 'conf/wcre',
             'venue_short': 'saner'
         },
         'ECSA': {
@@ -82,7 +76,6 @@ CONFERENCES = {
             'base_url': 'https://conf.researchr.org/series/ecsa',
             'type': 'dblp',
             'venue_key': 'conf/ecsa',
-            'venue_path': 'conf/ecsa',
             'venue_short': 'ecsa'
         },
         'OOPSLA': {
@@ -90,7 +83,6 @@ CONFERENCES = {
             'base_url': 'https://conf.researchr.org/series/splash',
             'type': 'dblp',
             'venue_key': 'conf/oopsla',
-            'venue_path': 'conf/oopsla',
             'venue_short': 'oopsla'
         },
         'RE': {
@@ -98,7 +90,6 @@ CONFERENCES = {
             'base_url': 'https://conf.researchr.org/series/RE',
             'type': 'dblp',
             'venue_key': 'conf/re',
-            'venue_path': 'conf/re',
             'venue_short': 're'
         },
         'ISSRE': {
@@ -106,7 +97,6 @@ CONFERENCES = {
             'base_url': 'https://conf.researchr.org/series/issre',
             'type': 'dblp',
             'venue_key': 'conf/issre',
-            'venue_path': 'conf/issre',
             'venue_short': 'issre'
         }
     },
@@ -118,7 +108,6 @@ CONFERENCES = {
             'base_url': 'https://icml.cc',
             'type': 'dblp',
             'venue_key': 'conf/icml',
-            'venue_path': 'conf/icml',
             'venue_short': 'icml'
         },
         'NIPS': {
@@ -126,7 +115,6 @@ CONFERENCES = {
             'base_url': 'https://neurips.cc',
             'type': 'dblp',
             'venue_key': 'conf/nips',
-            'venue_path': 'conf/nips',
             'venue_short': 'neurips'
         },
         'ICLR': {
@@ -134,7 +122,6 @@ CONFERENCES = {
             'base_url': 'https://iclr.cc',
             'type': 'dblp',
             'venue_key': 'conf/iclr',
-            'venue_path': 'conf/iclr',
             'venue_short': 'iclr',
             'track_types': ['oral', 'spotlight', 'poster']
         },
@@ -143,7 +130,6 @@ CONFERENCES = {
             'base_url': 'https://aaai.org',
             'type': 'dblp',
             'venue_key': 'conf/aaai',
-            'venue_path': 'conf/aaai',
             'venue_short': 'aaai'
         },
         'IJCAI': {
@@ -151,7 +137,6 @@ CONFERENCES = {
             'base_url': 'https://ijcai.org',
             'type': 'dblp',
             'venue_key': 'conf/ijcai',
-            'venue_path': 'conf/ijcai',
             'venue_short': 'ijcai'
         }
     },
@@ -189,13 +174,37 @@ CONFERENCES = {
     }
 }
 
+# DBLP venues are fetched from https://dblp.org/db/{venue_path}/..., which is the
+# venue_key for every configured conference; alias it rather than repeating it
+for _conferences in CONFERENCES.values():
+    for _config in _conferences.values():
+        if _config['type'] == 'dblp':
+            _config.setdefault('venue_path', _config['venue_key'])
+
+# The conference registry is static; expose it (and each category) read-only
+CONFERENCES = MappingProxyType({
+    _category: MappingProxyType(_conferences) for _category, _conferences in CONFERENCES.items()
+})
+
+# Flat acronym -> config and acronym -> category lookups across all categories
+CONFERENCE_INDEX = MappingProxyType({
+    _acronym: _config for _conferences in CONFERENCES.values() for _acronym, _config in _conferences.items()
+})
+CONFERENCE_DOMAIN = MappingProxyType({
+    _acronym: _category for _category, _conferences in CONFERENCES.items() for _acronym in _conferences
+})
+
 SCRAPER_CONFIG = {
     'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
     'request_delay': 1.0,  # seconds between requests
     'timeout': 30,
     'max_retries': 3,
+    'max_concurrent_scrapes': 10,  # conferences scraped in parallel by --scrape-all
+    'connection_pool_size': 20,  # keep-alive connections pooled per host by each scraper session
+    'requests_per_host_per_second': 5.0,  # token-bucket rate for concurrent async requests to one host
     'output_formats': ['json', 'csv', 'bibtex'],
-    'default_year_range': 5  # last 5 years by default
+    'default_year_range': 5,  # last 5 years by default
+    'cache_dir': str(Path(__file__).resolve().parent.parent / '.cache'),  # on-disk caches, anchored at the project root
 }
 
 DBLP_CONFIG = {
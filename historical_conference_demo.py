@@ -4,40 +4,81 @@ Demo script showcasing comprehensive historical conference support.
 Demonstrates the ability to handle conferences across 15 years with predecessor handling.
 """
 
+import io
 import sys
+from contextlib import redirect_stdout
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
 # Add the project root to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config.conferences import CONFERENCES
+from config.conferences import CONFERENCES, CONFERENCE_INDEX
 from config.conference_history import (
-    get_all_conferences, get_all_test_years, conference_exists_in_year,
+    ALL_CONFERENCES_SET, get_all_test_years, conference_exists_in_year,
     get_venue_for_year, get_predecessor_conferences, get_expected_min_papers
 )
-from src.scrapers import ScraperFactory
+
+
+# Static example data for the demo sections
+_PREDECESSOR_EXAMPLES = (
+    ('SANER', 'Started in 2015, predecessors: WCRE, CSMR'),
+    ('ICSME', 'Started in 2014, predecessor: ICSM'),
+    ('ICSA', 'Started in 2017, predecessor: WICSA'),
+)
+_PREDECESSOR_TEST_YEARS = (2010, 2012, 2014, 2015, 2016, 2017, 2018, 2020, 2023)
+_EVOLUTION_EXAMPLES = ('ICSE', 'FSE', 'SANER', 'ICSME', 'ICML', 'NIPS')
+_EVOLUTION_SAMPLE_YEARS = (2010, 2015, 2020, 2023)
+_SEARCH_EXAMPLES = (
+    ("Recent SE conference", "python main.py --scrape MSR --year 2023"),
+    ("Historical SE conference", "python main.py --scrape SANER --year 2015"),
+    ("Pre-rename conference", "python main.py --scrape ICSME --year 2014"),
+    ("Gap year (should fail)", "python main.py --scrape SANER --year 2014"),
+    ("AI/ML conference", "python main.py --scrape ICML --year 2020"),
+    ("Early ICLR", "python main.py --scrape ICLR --year 2013"),
+    ("Range scraping", "python main.py --scrape ICSE --year-range 2020 2023"),
+    ("All conferences", "python main.py --scrape-all --year 2023"),
+)
+
+
+@lru_cache(maxsize=None)
+def _scraper_for(conference_name: str):
+    """Create (once per run) the scraper for a configured conference."""
+    # Imported lazily: the scraper stack (requests, aiohttp, bs4) is only
+    # needed by the timeline sections, not the config-only ones
+    from src.scrapers import ScraperFactory
+    
+    config = CONFERENCE_INDEX.get(conference_name)
+    if not config:
+        return None
+    return ScraperFactory.create_scraper(config)
+
+
+@lru_cache(maxsize=None)
+def _timeline_for(conference_name: str):
+    """Get (once per run) the historical timeline for a conference, if supported."""
+    scraper = _scraper_for(conference_name)
+    if scraper is None or not scraper.supports_timeline:
+        return None
+    return scraper.get_conference_timeline()
 
 
 def show_conference_timeline(conference_name: str):
     """Show the timeline and historical mappings for a conference."""
+    conference_name = sys.intern(conference_name)
     print(f"\n🏛️  {conference_name} Conference Timeline")
     print("=" * 50)
     
     # Find the conference in our configuration
-    config = None
-    for category, conferences in CONFERENCES.items():
-        if conference_name in conferences:
-            config = conferences[conference_name]
-            break
-    
-    if not config:
+    if conference_name not in CONFERENCE_INDEX:
         print(f"Conference {conference_name} not found!")
         return
     
-    # Create scraper and get timeline
-    scraper = ScraperFactory.create_scraper(config)
-    timeline = scraper.get_conference_timeline()
+    timeline = _timeline_for(conference_name)
+    if timeline is None:
+        print(f"No historical timeline available for {conference_name}")
+        return
     
     print(f"Full name: {timeline['full_name']}")
     print(f"Current name: {timeline['current_name']}")
@@ -45,16 +86,23 @@ def show_conference_timeline(conference_name: str):
     if timeline['predecessors']:
         print(f"Predecessors: {', '.join(timeline['predecessors'])}")
     
-    print(f"\nAvailable years: {len(timeline['available_years'])} years")
-    print(f"Year range: {min(timeline['available_years'])}-{max(timeline['available_years'])}")
+    available_years = timeline['available_years']
+    year_mappings = timeline['year_mappings']
+    
+    print(f"\nAvailable years: {len(available_years)} years")
+    print(f"Year range: {timeline['year_min']}-{timeline['year_max']}")
     
     print(f"\nYear-by-year mappings:")
-    for year in sorted(timeline['year_mappings'].keys()):
-        mapping = timeline['year_mappings'][year]
+    lines = []
+    # available_years is built in ascending order from the same loop as year_mappings
+    for year in available_years:
+        mapping = year_mappings[year]
         venue_key = mapping['venue_key']
         venue_short = mapping['venue_short']
         expected_min = get_expected_min_papers(conference_name, year)
-        print(f"  {year}: {venue_key}/{venue_short} (expect ≥{expected_min} papers)")
+        lines.append(f"  {year}: {venue_key}/{venue_short} (expect ≥{expected_min} papers)")
+    if lines:
+        print("\n".join(lines))
 
 
 def show_historical_coverage_summary():
@@ -72,20 +120,19 @@ def show_historical_coverage_summary():
         print(f"\n{category_name} Conferences:")
         print("-" * 40)
         
-        if category_key not in CONFERENCES:
+        conferences = CONFERENCES.get(category_key)
+        if not conferences:
             continue
             
-        for conf_name, config in CONFERENCES[category_key].items():
-            if conf_name in get_all_conferences():
-                scraper = ScraperFactory.create_scraper(config)
+        for conf_name in conferences:
+            if conf_name in ALL_CONFERENCES_SET:
+                timeline = _timeline_for(conf_name)
                 
-                # Check if scraper has historical timeline capability
-                if hasattr(scraper, 'get_conference_timeline'):
-                    timeline = scraper.get_conference_timeline()
-                    
+                # Only scrapers with historical timeline capability return one
+                if timeline is not None:
                     available_years = len(timeline['available_years'])
                     if available_years > 0:
-                        year_range = f"{min(timeline['available_years'])}-{max(timeline['available_years'])}"
+                        year_range = f"{timeline['year_min']}-{timeline['year_max']}"
                         predecessors = len(timeline['predecessors'])
                         pred_str = f", {predecessors} predecessors" if predecessors > 0 else ""
                         
@@ -102,13 +149,7 @@ def show_predecessor_examples():
     print("\n🔄 PREDECESSOR CONFERENCE EXAMPLES")
     print("=" * 50)
     
-    examples = [
-        ('SANER', 'Started in 2015, predecessors: WCRE, CSMR'),
-        ('ICSME', 'Started in 2014, predecessor: ICSM'),
-        ('ICSA', 'Started in 2017, predecessor: WICSA'),
-    ]
-    
-    for conf_name, description in examples:
+    for conf_name, description in _PREDECESSOR_EXAMPLES:
         print(f"\n{conf_name}: {description}")
         
         predecessors = get_predecessor_conferences(conf_name)
@@ -116,11 +157,10 @@ def show_predecessor_examples():
             print(f"  Predecessor venues: {', '.join(predecessors)}")
         
         # Show when the conference started
-        test_years = [2010, 2012, 2014, 2015, 2016, 2017, 2018, 2020, 2023]
         available_years = []
         gap_years = []
         
-        for year in test_years:
+        for year in _PREDECESSOR_TEST_YEARS:
             if conference_exists_in_year(conf_name, year):
                 available_years.append(year)
             else:
@@ -137,16 +177,13 @@ def show_conference_evolution():
     print("=" * 50)
     
     # Show expected paper count growth
-    evolution_examples = ['ICSE', 'FSE', 'SANER', 'ICSME', 'ICML', 'NIPS']
-    
-    for conf_name in evolution_examples:
-        if conf_name not in get_all_conferences():
+    for conf_name in _EVOLUTION_EXAMPLES:
+        if conf_name not in ALL_CONFERENCES_SET:
             continue
             
         print(f"\n{conf_name} - Expected minimum papers over time:")
         
-        sample_years = [2010, 2015, 2020, 2023]
-        for year in sample_years:
+        for year in _EVOLUTION_SAMPLE_YEARS:
             if conference_exists_in_year(conf_name, year):
                 expected_min = get_expected_min_papers(conf_name, year)
                 try:
@@ -167,18 +204,7 @@ def demonstrate_historical_search():
     print()
     
     # Show examples for different conference categories
-    examples = [
-        ("Recent SE conference", "python main.py --scrape MSR --year 2023"),
-        ("Historical SE conference", "python main.py --scrape SANER --year 2015"),
-        ("Pre-rename conference", "python main.py --scrape ICSME --year 2014"),
-        ("Gap year (should fail)", "python main.py --scrape SANER --year 2014"),
-        ("AI/ML conference", "python main.py --scrape ICML --year 2020"),
-        ("Early ICLR", "python main.py --scrape ICLR --year 2013"),
-        ("Range scraping", "python main.py --scrape ICSE --year-range 2020 2023"),
-        ("All conferences", "python main.py --scrape-all --year 2023"),
-    ]
-    
-    for description, command in examples:
+    for description, command in _SEARCH_EXAMPLES:
         print(f"  {description}:")
         print(f"    {command}")
         print()
@@ -191,8 +217,8 @@ def demonstrate_historical_search():
     print("    - Generates detailed reporting")
 
 
-def main():
-    """Main demo function."""
+def run_demo():
+    """Print the full historical conference demo."""
     print("🧪 PaperHelper - Comprehensive Historical Conference Support")
     print("Testing conferences across 15 years (2009-2024) with predecessor handling")
     print("=" * 80)
@@ -225,5 +251,21 @@ def main():
     print("=" * 80)
 
 
+def main():
+    """Main demo function."""
+    if sys.stdout.isatty():
+        run_demo()
+        return
+    
+    # When piped or redirected, collect the report and emit it in a single write
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            run_demo()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
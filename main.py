@@ -9,16 +9,25 @@ This tool scrapes paper information from top (A*) conferences in:
 """
 
 import argparse
+import asyncio
+import heapq
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
 
 from src.scrapers import ScraperFactory
 from src.scrapers.citation_scrapers import CitationAggregator
-from src.utils import StorageManager, DataExporter, PaperFilter, PaperSearcher, PaperAnalyzer
+from src.utils import StorageManager, DataExporter, PaperFilter, PaperSearcher, PaperAnalyzer, InvertedIndex
 from src.utils.citation_utils import CitationAnalyzer, CitationTracker, CitationRecommender
-from config.conferences import CONFERENCES
+from src.utils.storage import author_names, safe_filename
+from src.utils.http_session import shared_session
+from config.conferences import CONFERENCES, CONFERENCE_INDEX, SCRAPER_CONFIG
 
 
 def setup_logging(verbose: bool = False):
@@ -46,17 +55,52 @@ def list_conferences():
             print(f"    Type: {info['type']}")
 
 
+def _scrape_with_config(config: dict, year: int):
+    """Create a scraper for a conference config and scrape one year."""
+    scraper = ScraperFactory.create_scraper(config, session=shared_session())
+    with scraper:
+        return scraper.scrape_papers(year)
+
+
+def _find_conference(conference_key: str):
+    """Look up a conference by acronym, returning (acronym, config) or (None, None)."""
+    acronym = conference_key.upper()
+    config = CONFERENCE_INDEX.get(acronym)
+    if config is None:
+        return None, None
+    return acronym, config
+
+
+def _scrape_and_save(conference_acronym: str, conference_config: dict, year: int,
+                     output_format: str = 'json'):
+    """Scrape one conference year and save it, returning (papers, file_path)."""
+    papers = _scrape_with_config(conference_config, year)
+    if not papers:
+        return papers, None
+    
+    storage = StorageManager()
+    filename = f"{conference_acronym}_{year}"
+    file_path = storage.save_papers(papers, filename, output_format)
+    return papers, file_path
+
+
+def _print_scrape_result(conference_acronym: str, year: int, papers, file_path, summarize: bool = True):
+    """Print the outcome of a single conference-year scrape."""
+    if not papers:
+        print(f"No papers found for {conference_acronym} {year}")
+        return
+    
+    print(f"Found {len(papers)} papers")
+    print(f"Results saved to: {file_path}")
+    
+    # Print summary
+    if summarize:
+        print_summary(papers)
+
+
 def scrape_conference(conference_key: str, year: int, output_format: str = 'json'):
     """Scrape a specific conference for a given year."""
-    # Find conference configuration
-    conference_config = None
-    conference_acronym = None
-    
-    for domain, conferences in CONFERENCES.items():
-        if conference_key.upper() in conferences:
-            conference_config = conferences[conference_key.upper()]
-            conference_acronym = conference_key.upper()
-            break
+    conference_acronym, conference_config = _find_conference(conference_key)
     
     if not conference_config:
         print(f"Conference '{conference_key}' not found.")
@@ -66,28 +110,8 @@ def scrape_conference(conference_key: str, year: int, output_format: str = 'json
     print(f"Scraping {conference_config['name']} ({conference_acronym}) for year {year}")
     
     try:
-        # Create scraper
-        scraper = ScraperFactory.create_scraper(conference_config)
-        
-        # Scrape papers
-        with scraper:
-            papers = scraper.scrape_papers(year)
-        
-        if not papers:
-            print(f"No papers found for {conference_acronym} {year}")
-            return
-        
-        print(f"Found {len(papers)} papers")
-        
-        # Save results
-        storage = StorageManager()
-        filename = f"{conference_acronym}_{year}"
-        file_path = storage.save_papers(papers, filename, output_format)
-        
-        print(f"Results saved to: {file_path}")
-        
-        # Print summary
-        print_summary(papers)
+        papers, file_path = _scrape_and_save(conference_acronym, conference_config, year, output_format)
+        _print_scrape_result(conference_acronym, year, papers, file_path)
         
     except Exception as e:
         logging.error(f"Error scraping {conference_acronym} {year}: {e}")
@@ -96,34 +120,89 @@ def scrape_conference(conference_key: str, year: int, output_format: str = 'json
 
 def scrape_multiple_years(conference_key: str, start_year: int, end_year: int, output_format: str = 'json'):
     """Scrape a conference for multiple years."""
-    for year in range(start_year, end_year + 1):
-        print(f"\nScraping year {year}...")
-        scrape_conference(conference_key, year, output_format)
+    conference_acronym, conference_config = _find_conference(conference_key)
+    
+    if not conference_config:
+        print(f"Conference '{conference_key}' not found.")
+        print("Use --list-conferences to see available conferences.")
+        return
+    
+    years = range(start_year, end_year + 1)
+    if not years:
+        return
+    
+    print(f"Scraping {conference_config['name']} ({conference_acronym}) for years {start_year}-{end_year}")
+    
+    all_papers = []
+    
+    # Each task creates its own scraper. They share the thread-safe pooled
+    # session from shared_session() and the per-host rate limiter in
+    # BaseScraper.get_page, so parallel years overlap parsing and saving
+    # while requests to the conference's host stay at request_delay spacing
+    with ThreadPoolExecutor(max_workers=min(8, len(years))) as executor:
+        futures = {
+            executor.submit(_scrape_and_save, conference_acronym, conference_config, year, output_format): year
+            for year in years
+        }
+        for future in as_completed(futures):
+            year = futures[future]
+            print(f"\nYear {year}:")
+            try:
+                papers, file_path = future.result()
+                _print_scrape_result(conference_acronym, year, papers, file_path, summarize=False)
+                if papers:
+                    all_papers.extend(papers)
+            except Exception as e:
+                logging.error(f"Error scraping {conference_acronym} {year}: {e}")
+                print(f"Error: {e}")
+    
+    # Analyse all years together once rather than rebuilding the statistics per year
+    print_summary(all_papers)
 
 
 def scrape_all_conferences(year: int, output_format: str = 'json'):
     """Scrape all conferences for a given year."""
     all_papers = []
     
-    for domain, conferences in CONFERENCES.items():
-        print(f"\nScraping {domain} conferences for {year}...")
+    jobs = [
+        (domain, acronym, config)
+        for domain, conferences in CONFERENCES.items()
+        for acronym, config in conferences.items()
+    ]
+    print(f"\nScraping {len(jobs)} conferences for {year}...")
+    
+    # Papers co-listed by several venues are kept once, keyed by DOI or (title, year)
+    seen_keys = set()
+    duplicates_skipped = 0
+    
+    # Scraping is network-bound, so overlap the requests and report in order afterwards
+    with ThreadPoolExecutor(max_workers=SCRAPER_CONFIG['max_concurrent_scrapes']) as executor:
+        futures = [executor.submit(_scrape_with_config, config, year) for _, _, config in jobs]
+    
+    current_domain = None
+    for (domain, acronym, config), future in zip(jobs, futures):
+        if domain != current_domain:
+            print(f"\n{domain} conferences:")
+            current_domain = domain
         
-        for acronym, config in conferences.items():
-            try:
-                scraper = ScraperFactory.create_scraper(config)
-                
-                with scraper:
-                    papers = scraper.scrape_papers(year)
-                
-                if papers:
-                    all_papers.extend(papers)
-                    print(f"  {acronym}: {len(papers)} papers")
-                else:
-                    print(f"  {acronym}: No papers found")
-                    
-            except Exception as e:
-                logging.error(f"Error scraping {acronym}: {e}")
-                print(f"  {acronym}: Error - {e}")
+        try:
+            result = future.result()
+        except Exception as e:
+            logging.error(f"Error scraping {acronym}: {e}")
+            print(f"  {acronym}: Error - {e}")
+            continue
+        
+        if result:
+            for paper in result:
+                key = paper.doi.lower() if paper.doi else (paper.title.lower().strip(), paper.year)
+                if key in seen_keys:
+                    duplicates_skipped += 1
+                    continue
+                seen_keys.add(key)
+                all_papers.append(paper)
+            print(f"  {acronym}: {len(result)} papers")
+        else:
+            print(f"  {acronym}: No papers found")
     
     if all_papers:
         # Save combined results
@@ -133,39 +212,65 @@ def scrape_all_conferences(year: int, output_format: str = 'json'):
         
         print(f"\nCombined results saved to: {file_path}")
         print(f"Total papers scraped: {len(all_papers)}")
+        if duplicates_skipped:
+            print(f"Duplicate papers skipped: {duplicates_skipped}")
         
         # Print analysis
         analyzer = PaperAnalyzer(all_papers)
         venue_dist = analyzer.get_venue_distribution()
         
         print("\nPapers by venue:")
-        for venue, count in list(venue_dist.items())[:10]:
+        for venue, count in _top_items(venue_dist, 10):
             print(f"  {venue}: {count}")
 
 
+@lru_cache(maxsize=8)
+def _load_search_corpus_cached(data_file: str, mtime_ns: int, size: int):
+    """Build (paper_data, lowercased title/abstract haystacks, index); the stat fields in the key invalidate stale entries."""
+    storage = StorageManager()
+    paper_data = storage.load_papers(data_file)
+    haystacks = [
+        (paper_dict.get('title', '') + '\n' + (paper_dict.get('abstract') or '')).lower()
+        for paper_dict in paper_data
+    ]
+    index = InvertedIndex.build(haystacks)
+    return paper_data, haystacks, index
+
+
+def _load_search_corpus(data_file: str):
+    """Load a papers file with its search text and index, reusing them while the file is unchanged."""
+    path = Path(data_file).resolve()
+    stat = path.stat()
+    return _load_search_corpus_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
 def search_papers(query: str, data_file: str):
     """Search through previously scraped papers."""
     try:
-        storage = StorageManager()
-        paper_data = storage.load_papers(data_file)
+        paper_data, haystacks, index = _load_search_corpus(data_file)
         
         # Convert to Paper objects (simplified - you might want to implement proper deserialization)
         print(f"Searching in {len(paper_data)} papers for: '{query}'")
         
         # This is a simplified search - in practice you'd convert back to Paper objects
-        matching_papers = []
-        for paper_dict in paper_data:
-            title = paper_dict.get('title', '').lower()
-            abstract = paper_dict.get('abstract', '').lower() if paper_dict.get('abstract') else ''
-            
-            if query.lower() in title or query.lower() in abstract:
-                matching_papers.append(paper_dict)
+        query_lower = query.lower()
+        candidate_ids = index.candidates(query_lower)
+        if candidate_ids is None:
+            candidate_ids = range(len(paper_data))
+        else:
+            candidate_ids = sorted(candidate_ids)
+        
+        # The index only narrows the candidates; confirm the phrase match on each
+        matching_papers = [
+            paper_data[i] for i in candidate_ids
+            if query_lower in haystacks[i]
+        ]
         
         print(f"Found {len(matching_papers)} matching papers:")
         for i, paper in enumerate(matching_papers[:10], 1):
             print(f"{i}. {paper.get('title', 'No title')}")
             if paper.get('authors'):
-                authors = [author.get('name', '') for author in paper['authors']]
+                authors = author_names(paper)
                 print(f"   Authors: {', '.join(authors)}")
             print(f"   Year: {paper.get('year', 'Unknown')}")
             print()
@@ -177,7 +282,8 @@ def search_papers(query: str, data_file: str):
         print(f"Error searching papers: {e}")
 
 
-def find_paper_citations(title: str, max_papers: int = 50, output_format: str = 'json', use_google_scholar: bool = True):
+def find_paper_citations(title: str, max_papers: int = 50, output_format: str = 'json', use_google_scholar: bool = True,
+                         refresh: bool = False):
     """Find citations and references for a given paper title."""
     print(f"Finding citations and references for: '{title}'")
     if use_google_scholar:
@@ -185,10 +291,12 @@ def find_paper_citations(title: str, max_papers: int = 50, output_format: str =
     
     try:
         # Initialize citation aggregator
-        aggregator = CitationAggregator()
+        aggregator = CitationAggregator(session=shared_session(), refresh=refresh)
         
         # Get citation network with Google Scholar option
-        central_paper, citations, references = aggregator.find_paper_citations(title, max_papers, use_google_scholar)
+        central_paper, citations, references = asyncio.run(
+            aggregator.find_paper_citations_async(title, max_papers, use_google_scholar)
+        )
         
         if not central_paper:
             print(f"Could not find paper: '{title}'")
@@ -213,39 +321,49 @@ def find_paper_citations(title: str, max_papers: int = 50, output_format: str =
         tracker = CitationTracker(storage)
         
         # Create safe filename
-        safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_title = safe_title.replace(' ', '_')[:50]
-        
-        network_file = tracker.save_citation_network(network, safe_title)
-        print(f"Citation network saved to: {network_file}")
-        
-        # Save individual lists
-        if network.citations:
-            citations_file = storage.save_papers(network.citations, f"{safe_title}_citations", output_format)
-            print(f"Citations saved to: {citations_file}")
+        safe_title = safe_filename(title)
         
-        if network.references:
-            references_file = storage.save_papers(network.references, f"{safe_title}_references", output_format)
-            print(f"References saved to: {references_file}")
-        
-        # Generate analysis
-        analyzer = CitationAnalyzer()
-        analysis = analyzer.analyze_citation_network(network)
-        
-        print_citation_analysis(analysis)
-        
-        # Export graph visualization
-        try:
-            graph_file = tracker.export_citation_graph(network, 'json')
-            print(f"Citation graph exported to: {graph_file}")
-        except Exception as e:
-            print(f"Warning: Could not export graph: {e}")
+        # The output files are independent, so write them in parallel while the analysis runs
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            network_future = executor.submit(tracker.save_citation_network, network, safe_title)
+            
+            # Save individual lists (empty lists have nothing to write)
+            citations_future = references_future = None
+            if network.citations:
+                citations_future = executor.submit(storage.save_papers, network.citations, f"{safe_title}_citations", output_format)
+            if network.references:
+                references_future = executor.submit(storage.save_papers, network.references, f"{safe_title}_references", output_format)
+            
+            # Export graph visualization
+            graph_future = executor.submit(tracker.export_citation_graph, network, 'json')
+            
+            print(f"Citation network saved to: {network_future.result()}")
+            if citations_future:
+                print(f"Citations saved to: {citations_future.result()}")
+            if references_future:
+                print(f"References saved to: {references_future.result()}")
+            
+            # Generate analysis
+            analyzer = CitationAnalyzer()
+            analysis = analyzer.analyze_citation_network(network)
+            
+            print_citation_analysis(analysis)
+            
+            try:
+                print(f"Citation graph exported to: {graph_future.result()}")
+            except Exception as e:
+                print(f"Warning: Could not export graph: {e}")
         
     except Exception as e:
         logging.error(f"Error finding citations for '{title}': {e}")
         print(f"Error: {e}")
 
 
+def _top_items(counts: dict, k: int):
+    """Return the k highest-count (key, count) pairs, ties kept in insertion order."""
+    return heapq.nlargest(k, counts.items(), key=itemgetter(1))
+
+
 def print_citation_analysis(analysis: dict):
     """Print citation analysis results."""
     print("\n" + "=" * 60)
@@ -272,24 +390,24 @@ def print_citation_analysis(analysis: dict):
     
     if venue['reference_venues']:
         print("\nTop venues in references:")
-        for venue_name, count in list(venue['reference_venues'].items())[:5]:
+        for venue_name, count in _top_items(venue['reference_venues'], 5):
             print(f"  {venue_name}: {count} papers")
     
     if venue['citation_venues']:
         print("\nTop venues citing this paper:")
-        for venue_name, count in list(venue['citation_venues'].items())[:5]:
+        for venue_name, count in _top_items(venue['citation_venues'], 5):
             print(f"  {venue_name}: {count} papers")
     
     # Author analysis
     author = analysis['author_analysis']
     if author['top_citing_authors']:
         print("\nTop citing authors:")
-        for author_name, count in list(author['top_citing_authors'].items())[:5]:
+        for author_name, count in _top_items(author['top_citing_authors'], 5):
             print(f"  {author_name}: {count} papers")
     
     if author['potential_collaborators']:
         print(f"\nPotential collaborators: {len(author['potential_collaborators'])}")
-        for collaborator in list(author['potential_collaborators'])[:5]:
+        for collaborator in islice(author['potential_collaborators'], 5):
             print(f"  {collaborator}")
     
     # Impact metrics
@@ -301,13 +419,13 @@ def print_citation_analysis(analysis: dict):
     print(f"  Influence score: {impact['influence_score']:.2f}")
 
 
-def recommend_related_papers(title: str, max_recommendations: int = 10):
+def recommend_related_papers(title: str, max_recommendations: int = 10, refresh: bool = False):
     """Recommend related papers based on citation analysis."""
     print(f"Finding recommendations for: '{title}'")
     
     try:
         # Get citation network
-        aggregator = CitationAggregator()
+        aggregator = CitationAggregator(session=shared_session(), refresh=refresh)
         network = aggregator.get_enriched_citation_network(title)
         
         if not network:
@@ -428,6 +546,8 @@ Examples:
                        help='Use Google Scholar for citation extraction (default: enabled)')
     parser.add_argument('--no-scholar', action='store_true',
                        help='Disable Google Scholar and use only APIs')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore cached citation data and fetch it again')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
     
@@ -457,10 +577,10 @@ Examples:
     
     elif args.citations:
         use_scholar = args.use_scholar and not args.no_scholar
-        find_paper_citations(args.citations, args.max_papers, args.format, use_scholar)
+        find_paper_citations(args.citations, args.max_papers, args.format, use_scholar, refresh=args.no_cache)
     
     elif args.recommend:
-        recommend_related_papers(args.recommend, args.max_papers)
+        recommend_related_papers(args.recommend, args.max_papers, refresh=args.no_cache)
     
     else:
         parser.print_help()
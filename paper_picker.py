@@ -3,27 +3,28 @@
 Paper Picker - Simple tool to list conference papers and generate search URLs
 """
 
-import json
 import argparse
 import sys
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Sequence
 from urllib.parse import quote_plus
 
-from src.utils.storage import StorageManager
+from src.utils import json_utils
+from src.utils.storage import PaperSource, StorageManager, author_names, safe_filename
 
 
-def load_conference_papers(conference_file: str) -> List[Dict[str, Any]]:
+def load_conference_papers(conference_file: str) -> Sequence[Dict[str, Any]]:
     """Load papers from a conference JSON file."""
     try:
-        storage = StorageManager()
-        papers = storage.load_papers(conference_file)
-        return papers
+        # Large files are paged in lazily as papers are browsed
+        return PaperSource(conference_file)
     except Exception as e:
         print(f"Error loading conference file: {e}")
         return []
 
 
-def list_papers_with_numbers(papers: List[Dict[str, Any]], start: int = 1, end: int = None):
+def list_papers_with_numbers(papers: Sequence[Dict[str, Any]], start: int = 1, end: int = None):
     """Display papers with numbers for easy selection."""
     if end is None:
         end = len(papers)
@@ -36,76 +37,87 @@ def list_papers_with_numbers(papers: List[Dict[str, Any]], start: int = 1, end:
     for i in range(start - 1, end):
         paper = papers[i]
         title = paper.get('title', 'No title')
-        authors = paper.get('authors', [])
-        author_names = [author.get('name', '') for author in authors]
+        names = author_names(paper)
         
         print(f"{i+1:3d}. {title}")
-        if author_names:
-            print(f"     Authors: {', '.join(author_names[:3])}")
-            if len(author_names) > 3:
-                print(f"              ... and {len(author_names) - 3} more")
+        if names:
+            print(f"     Authors: {', '.join(names[:3])}")
+            if len(names) > 3:
+                print(f"              ... and {len(names) - 3} more")
         print(f"     Year: {paper.get('year', 'Unknown')}")
         if paper.get('track_type'):
             print(f"     Track: {paper.get('track_type')}")
         print()
 
 
+def _search_queries(paper_title: str, paper_authors: List[str] = None) -> Dict[str, str]:
+    """URL-encode each search query for a paper once, for reuse across all search URLs."""
+    # Clean title for URLs
+    clean_title = paper_title.replace('"', '').replace("'", "")
+    
+    queries = {
+        'title': quote_plus(clean_title),
+        'scholar': quote_plus(f'"{clean_title}"'),
+        'semantic': quote_plus(clean_title.replace(":", "").replace("?", "")),
+    }
+    
+    if paper_authors:
+        first_author = paper_authors[0].split()[-1]  # Last name
+        queries['dblp'] = quote_plus(f"{first_author} {clean_title.split()[0]}")
+    
+    return queries
+
+
 def generate_search_urls(paper_title: str, paper_authors: List[str] = None):
     """Generate search URLs for manual citation lookup."""
     print(f"\nSearch URLs for: '{paper_title}'")
     print("=" * 80)
     
-    # Clean title for URLs
-    clean_title = paper_title.replace('"', '').replace("'", "")
+    queries = _search_queries(paper_title, paper_authors)
     
     # Google Scholar URL
-    scholar_query = f'"{clean_title}"'
-    scholar_url = f"https://scholar.google.com/scholar?q={quote_plus(scholar_query)}&hl=en"
+    scholar_url = f"https://scholar.google.com/scholar?q={queries['scholar']}&hl=en"
     print(f"Google Scholar:")
     print(f"  {scholar_url}")
     print()
     
     # Semantic Scholar URL
-    semantic_query = clean_title.replace(":", "").replace("?", "")
-    semantic_url = f"https://www.semanticscholar.org/search?q={quote_plus(semantic_query)}"
+    semantic_url = f"https://www.semanticscholar.org/search?q={queries['semantic']}"
     print(f"Semantic Scholar:")
     print(f"  {semantic_url}")
     print()
     
     # DBLP URL (if authors provided)
-    if paper_authors:
-        first_author = paper_authors[0].split()[-1]  # Last name
-        dblp_query = f"{first_author} {clean_title.split()[0]}"
-        dblp_url = f"https://dblp.org/search?q={quote_plus(dblp_query)}"
+    if 'dblp' in queries:
+        dblp_url = f"https://dblp.org/search?q={queries['dblp']}"
         print(f"DBLP:")
         print(f"  {dblp_url}")
         print()
     
     # ACM Digital Library URL  
-    acm_url = f"https://dl.acm.org/action/doSearch?AllField={quote_plus(clean_title)}"
+    acm_url = f"https://dl.acm.org/action/doSearch?AllField={queries['title']}"
     print(f"ACM Digital Library:")
     print(f"  {acm_url}")
     print()
     
     # IEEE Xplore URL
-    ieee_url = f"https://ieeexplore.ieee.org/search/searchresult.jsp?queryText={quote_plus(clean_title)}"
+    ieee_url = f"https://ieeexplore.ieee.org/search/searchresult.jsp?queryText={queries['title']}"
     print(f"IEEE Xplore:")
     print(f"  {ieee_url}")
     print()
 
 
-def save_paper_info(paper: Dict[str, Any], paper_number: int):
-    """Save paper information to a file for reference."""
-    storage = StorageManager()
-    
+def _write_paper_info(paper: Dict[str, Any], paper_number: int, output_dir: Path) -> str:
+    """Write one paper's info file and return its path."""
     title = paper.get('title', 'No title')
-    safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-    safe_title = safe_title.replace(' ', '_')[:50]
+    safe_title = safe_filename(title)
+    
+    authors = author_names(paper)
     
     paper_info = {
         'paper_number': paper_number,
         'title': title,
-        'authors': [author.get('name', '') for author in paper.get('authors', [])],
+        'authors': authors,
         'year': paper.get('year'),
         'venue': paper.get('venue'),
         'doi': paper.get('doi'),
@@ -114,32 +126,48 @@ def save_paper_info(paper: Dict[str, Any], paper_number: int):
     }
     
     # Generate search URLs
-    authors = [author.get('name', '') for author in paper.get('authors', [])]
-    clean_title = title.replace('"', '').replace("'", "")
-    
-    scholar_query = f'"{clean_title}"'
+    queries = _search_queries(title, authors)
     paper_info['search_urls'] = {
-        'google_scholar': f"https://scholar.google.com/scholar?q={quote_plus(scholar_query)}&hl=en",
-        'semantic_scholar': f"https://www.semanticscholar.org/search?q={quote_plus(clean_title)}",
-        'acm_dl': f"https://dl.acm.org/action/doSearch?AllField={quote_plus(clean_title)}",
-        'ieee_xplore': f"https://ieeexplore.ieee.org/search/searchresult.jsp?queryText={quote_plus(clean_title)}"
+        'google_scholar': f"https://scholar.google.com/scholar?q={queries['scholar']}&hl=en",
+        'semantic_scholar': f"https://www.semanticscholar.org/search?q={queries['title']}",
+        'acm_dl': f"https://dl.acm.org/action/doSearch?AllField={queries['title']}",
+        'ieee_xplore': f"https://ieeexplore.ieee.org/search/searchresult.jsp?queryText={queries['title']}"
     }
     
-    if authors:
-        first_author = authors[0].split()[-1]
-        dblp_query = f"{first_author} {clean_title.split()[0]}"
-        paper_info['search_urls']['dblp'] = f"https://dblp.org/search?q={quote_plus(dblp_query)}"
+    if 'dblp' in queries:
+        paper_info['search_urls']['dblp'] = f"https://dblp.org/search?q={queries['dblp']}"
     
     # Save to file
-    info_file = storage.output_dir / f"paper_{paper_number:03d}_{safe_title}_info.json"
-    with open(info_file, 'w', encoding='utf-8') as f:
-        json.dump(paper_info, f, indent=2, ensure_ascii=False)
+    info_file = output_dir / f"paper_{paper_number:03d}_{safe_title}_info.json"
+    json_utils.dump_file(paper_info, info_file, indent=True)
     
-    print(f"Paper info saved to: {info_file}")
     return str(info_file)
 
 
-def interactive_mode(papers: List[Dict[str, Any]]):
+def save_paper_info(paper: Dict[str, Any], paper_number: int):
+    """Save paper information to a file for reference."""
+    storage = StorageManager()
+    info_file = _write_paper_info(paper, paper_number, storage.output_dir)
+    
+    print(f"Paper info saved to: {info_file}")
+    return info_file
+
+
+def bulk_save_paper_info(papers: List[Dict[str, Any]], start: int = 1, max_workers: int = 8) -> List[str]:
+    """Save info files for many papers, numbered from start, writing them in parallel."""
+    storage = StorageManager()
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        info_files = list(executor.map(
+            lambda numbered: _write_paper_info(numbered[1], numbered[0], storage.output_dir),
+            enumerate(papers, start)
+        ))
+    
+    print(f"Saved info for {len(info_files)} papers to: {storage.output_dir}")
+    return info_files
+
+
+def interactive_mode(papers: Sequence[Dict[str, Any]]):
     """Interactive mode for browsing papers."""
     current_page = 1
     papers_per_page = 10
@@ -180,7 +208,7 @@ def interactive_mode(papers: List[Dict[str, Any]]):
                 if 1 <= paper_num <= len(papers):
                     selected_paper = papers[paper_num - 1]
                     title = selected_paper['title']
-                    authors = [author.get('name', '') for author in selected_paper.get('authors', [])]
+                    authors = author_names(selected_paper)
                     
                     print(f"\nSelected Paper #{paper_num}:")
                     print(f"Title: {title}")
@@ -219,6 +247,7 @@ Examples:
   %(prog)s --file output/ICSE_2014.json
   %(prog)s --file output/ICSE_2014.json --paper 5
   %(prog)s --file output/ICSE_2014.json --list --range 1 10
+  %(prog)s --file output/ICSE_2014.json --list --range 1 10 --save-info
         """
     )
     
@@ -231,7 +260,7 @@ Examples:
     parser.add_argument('--range', nargs=2, type=int, metavar=('START', 'END'),
                        help='Show papers in range (e.g., --range 1 10)')
     parser.add_argument('--save-info', action='store_true',
-                       help='Save paper info to file when using --paper')
+                       help='Save paper info to file when using --paper (or for every listed paper with --list)')
     
     args = parser.parse_args()
     
@@ -249,6 +278,11 @@ Examples:
             list_papers_with_numbers(papers, args.range[0], args.range[1])
         else:
             list_papers_with_numbers(papers)
+        
+        # Save info files for every listed paper if requested
+        if args.save_info:
+            start, end = args.range if args.range else (1, len(papers))
+            bulk_save_paper_info(papers[start - 1:end], start)
             
     elif args.paper:
         if not (1 <= args.paper <= len(papers)):
@@ -257,7 +291,7 @@ Examples:
             
         selected_paper = papers[args.paper - 1]
         title = selected_paper['title']
-        authors = [author.get('name', '') for author in selected_paper.get('authors', [])]
+        authors = author_names(selected_paper)
         
         print(f"\nPaper #{args.paper}:")
         print(f"Title: {title}")
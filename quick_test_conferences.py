@@ -6,9 +6,21 @@ Quick test of key conferences to identify any major issues.
 import subprocess
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Tuple
 import time
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from config.conferences import CONFERENCE_INDEX
+
+PROJECT_ROOT = Path('/home/yu/project/PaperHelper')
+OUTPUT_DIR = PROJECT_ROOT / 'output'
+
 # Quick test configuration: one recent year for each major conference
 QUICK_TESTS = [
     ('ICSE', 2023),
@@ -22,55 +34,82 @@ QUICK_TESTS = [
     ('EMNLP', 2023)
 ]
 
+def _read_total_papers(output_file: Path) -> int:
+    """Read the total_papers header without loading the whole output file."""
+    if ijson is None:
+        with open(output_file) as f:
+            return json.load(f).get('total_papers', 0)
+    
+    # total_papers is written before the papers list, so this stops early
+    with open(output_file, 'rb') as f:
+        return next(ijson.items(f, 'total_papers'), 0)
+
+
+def _run_one(conference: str, year: int) -> Tuple[str, Tuple]:
+    """Scrape one conference in a subprocess; return (status line, result tuple)."""
+    cmd = ['python', 'main.py', '--scrape', conference, '--year', str(year)]
+    start_time = time.time()
+    
+    try:
+        # Only the exit code and output file are checked, so discard the
+        # child's output rather than piping it back through reader threads
+        result = subprocess.run(
+            cmd, 
+            stdout=subprocess.DEVNULL, 
+            stderr=subprocess.DEVNULL, 
+            timeout=60,
+            cwd=PROJECT_ROOT
+        )
+        
+        elapsed = time.time() - start_time
+        
+        if result.returncode == 0:
+            # Check output file (opening it directly saves a separate stat)
+            try:
+                papers = _read_total_papers(OUTPUT_DIR / f'{conference}_{year}.json')
+            except FileNotFoundError:
+                return f"❌ No output", (conference, year, False, 0, elapsed)
+            return f"✅ {papers} papers ({elapsed:.1f}s)", (conference, year, True, papers, elapsed)
+        else:
+            return f"❌ Failed", (conference, year, False, 0, elapsed)
+            
+    except subprocess.TimeoutExpired:
+        return f"❌ Timeout", (conference, year, False, 0, 60)
+    except Exception as e:
+        return f"❌ Error: {e}", (conference, year, False, 0, 0)
+
+
+def _run_group(tests: List[Tuple[str, int]]) -> Dict[Tuple[str, int], Tuple]:
+    """Run tests that scrape the same site one after another."""
+    results = {}
+    for conference, year in tests:
+        status, result = _run_one(conference, year)
+        print(f"Testing {conference} {year}... {status}", flush=True)
+        results[(conference, year)] = result
+    return results
+
+
 def run_quick_test():
     """Run quick tests on key conferences."""
     print("🧪 Running quick conference tests...")
     print("=" * 60)
     
-    results = []
-    total_papers = 0
-    
+    # Each subprocess paces only its own requests, so running every test at
+    # once would hit a shared site (e.g. DBLP) several times over its request
+    # delay. Group the tests by scraper type, i.e. by site: different sites
+    # are scraped in parallel, tests of one site run one at a time
+    groups: Dict[str, List[Tuple[str, int]]] = {}
     for conference, year in QUICK_TESTS:
-        print(f"Testing {conference} {year}... ", end='', flush=True)
-        
-        cmd = ['python', 'main.py', '--scrape', conference, '--year', str(year)]
-        start_time = time.time()
-        
-        try:
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                timeout=60,
-                cwd='/home/yu/project/PaperHelper'
-            )
-            
-            elapsed = time.time() - start_time
-            
-            if result.returncode == 0:
-                # Check output file
-                output_file = Path(f'/home/yu/project/PaperHelper/output/{conference}_{year}.json')
-                if output_file.exists():
-                    with open(output_file) as f:
-                        data = json.load(f)
-                        papers = data.get('total_papers', 0)
-                        total_papers += papers
-                        
-                        print(f"✅ {papers} papers ({elapsed:.1f}s)")
-                        results.append((conference, year, True, papers, elapsed))
-                else:
-                    print(f"❌ No output")
-                    results.append((conference, year, False, 0, elapsed))
-            else:
-                print(f"❌ Failed")
-                results.append((conference, year, False, 0, elapsed))
-                
-        except subprocess.TimeoutExpired:
-            print(f"❌ Timeout")
-            results.append((conference, year, False, 0, 60))
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            results.append((conference, year, False, 0, 0))
+        groups.setdefault(CONFERENCE_INDEX[conference]['type'], []).append((conference, year))
+    
+    results_by_test = {}
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        for group_results in executor.map(_run_group, groups.values()):
+            results_by_test.update(group_results)
+    
+    # Report in the configured order regardless of completion order
+    results = [results_by_test[test] for test in QUICK_TESTS]
+    total_papers = sum(r[3] for r in results)
     
     # Summary
     passed = sum(1 for r in results if r[2])
@@ -28,17 +28,7 @@ def discover_and_run_tests():
     
     suite = loader.discover(str(test_dir), pattern='test*.py')
     
-    # Count total tests
-    def count_tests(test_suite):
-        count = 0
-        for test in test_suite:
-            if hasattr(test, '__iter__'):
-                count += count_tests(test)
-            else:
-                count += 1
-        return count
-    
-    total_tests = count_tests(suite)
+    total_tests = suite.countTestCases()
     print(f"Found {total_tests} tests")
     print()
     
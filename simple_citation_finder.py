@@ -3,21 +3,31 @@
 Simple Citation Finder - Streamlined tool for manual citation lookup
 """
 
-import json
 import argparse
+import os
 import sys
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
 
+from src.models.paper import Paper
 from src.scrapers.citation_scrapers import GoogleScholarScraper
-from src.utils.storage import StorageManager
+from src.utils import json_utils
+from src.utils.storage import StorageManager, author_names, safe_filename
+
+
+@lru_cache(maxsize=8)
+def _load_papers_cached(conference_file: str, mtime_ns: int, size: int) -> List[Dict[str, Any]]:
+    """Parse a conference file; the stat fields in the key invalidate stale entries."""
+    return StorageManager.load_papers(conference_file)
 
 
 def load_conference_papers(conference_file: str) -> List[Dict[str, Any]]:
-    """Load papers from a conference JSON file."""
+    """Load papers from a conference JSON file, reusing the parse while it is unchanged."""
     try:
-        storage = StorageManager()
-        papers = storage.load_papers(conference_file)
-        return papers
+        stat = os.stat(conference_file)
+        return _load_papers_cached(conference_file, stat.st_mtime_ns, stat.st_size)
     except Exception as e:
         print(f"Error loading conference file: {e}")
         return []
@@ -25,142 +35,146 @@ def load_conference_papers(conference_file: str) -> List[Dict[str, Any]]:
 
 def list_papers_with_numbers(papers: List[Dict[str, Any]]):
     """Display papers with numbers for easy selection."""
-    print(f"\nFound {len(papers)} papers:")
-    print("=" * 80)
+    # Build the whole listing and write it once instead of printing line by line
+    lines = [f"\nFound {len(papers)} papers:\n", "=" * 80, "\n"]
     
     for i, paper in enumerate(papers, 1):
         title = paper.get('title', 'No title')
-        authors = paper.get('authors', [])
-        author_names = [author.get('name', '') for author in authors]
+        names = author_names(paper)
         
-        print(f"{i:3d}. {title}")
-        if author_names:
-            print(f"     Authors: {', '.join(author_names[:3])}")
-            if len(author_names) > 3:
-                print(f"              ... and {len(author_names) - 3} more")
-        print(f"     Year: {paper.get('year', 'Unknown')}")
-        print()
+        lines.append(f"{i:3d}. {title}\n")
+        if names:
+            lines.append(f"     Authors: {', '.join(names[:3])}\n")
+            if len(names) > 3:
+                lines.append(f"              ... and {len(names) - 3} more\n")
+        lines.append(f"     Year: {paper.get('year', 'Unknown')}\n\n")
+    
+    sys.stdout.write(''.join(lines))
+
+
+def _report_papers(papers: List[Paper], found_label: str, empty_message: str) -> List[Dict[str, Any]]:
+    """Print a numbered listing of looked-up papers and return them as dicts."""
+    if not papers:
+        print(empty_message)
+        return []
+    
+    # Convert first, then print from the dicts so each paper's fields are read once
+    summaries = [paper.to_summary_dict() for paper in papers]
+    
+    lines = [f"Found {len(papers)} {found_label}:\n"]
+    append = lines.append
+    for i, summary in enumerate(summaries, 1):
+        append(f"{i:3d}. {summary['title']}\n")
+        if summary['authors']:
+            append(f"     Authors: {', '.join(summary['authors'][:3])}\n")
+        append(f"     Year: {summary['year'] or 'Unknown'}\n")
+        if summary['citation_count']:
+            append(f"     Citations: {summary['citation_count']}\n")
+        append("\n")
+    sys.stdout.write(''.join(lines))
+    
+    return summaries
 
 
-def get_citations_for_paper(paper_title: str, max_citations: int = 20) -> List[Dict[str, Any]]:
+def get_citations_for_paper(paper_title: str, max_citations: int = 20,
+                            scholar: Optional[GoogleScholarScraper] = None) -> List[Dict[str, Any]]:
     """Get citations for a specific paper using Google Scholar."""
     print(f"\nFinding citations for: '{paper_title}'")
     print("Using Google Scholar...")
     
     try:
-        with GoogleScholarScraper() as scholar:
+        # Reuse the caller's scraper (and its session) when one is given
+        with nullcontext(scholar) if scholar is not None else GoogleScholarScraper() as scholar:
             citations = scholar.get_citations(paper_title, max_citations)
-            
-            if citations:
-                print(f"Found {len(citations)} citing papers:")
-                
-                citing_papers = []
-                for i, paper in enumerate(citations, 1):
-                    citing_paper = {
-                        'title': paper.title,
-                        'authors': [author.name for author in paper.authors],
-                        'year': paper.year,
-                        'venue': paper.venue,
-                        'url': paper.url,
-                        'citation_count': paper.citation_count,
-                        'abstract': paper.abstract
-                    }
-                    citing_papers.append(citing_paper)
-                    
-                    print(f"{i:3d}. {paper.title}")
-                    if paper.authors:
-                        author_names = [author.name for author in paper.authors[:3]]
-                        print(f"     Authors: {', '.join(author_names)}")
-                    print(f"     Year: {paper.year or 'Unknown'}")
-                    if paper.citation_count:
-                        print(f"     Citations: {paper.citation_count}")
-                    print()
-                
-                return citing_papers
-            else:
-                print("No citations found.")
-                return []
+        return _report_papers(citations, "citing papers", "No citations found.")
                 
     except Exception as e:
         print(f"Error finding citations: {e}")
         return []
 
 
-def get_references_for_paper(paper_title: str, max_references: int = 20) -> List[Dict[str, Any]]:
+def get_references_for_paper(paper_title: str, max_references: int = 20,
+                             scholar: Optional[GoogleScholarScraper] = None) -> List[Dict[str, Any]]:
     """Get related papers (references) using Google Scholar."""
     print(f"\nFinding related papers for: '{paper_title}'")
     print("Using Google Scholar...")
     
     try:
-        with GoogleScholarScraper() as scholar:
+        with nullcontext(scholar) if scholar is not None else GoogleScholarScraper() as scholar:
             related_papers = scholar.get_related_papers(paper_title, max_references)
-            
-            if related_papers:
-                print(f"Found {len(related_papers)} related papers:")
-                
-                reference_papers = []
-                for i, paper in enumerate(related_papers, 1):
-                    ref_paper = {
-                        'title': paper.title,
-                        'authors': [author.name for author in paper.authors],
-                        'year': paper.year,
-                        'venue': paper.venue,
-                        'url': paper.url,
-                        'citation_count': paper.citation_count,
-                        'abstract': paper.abstract
-                    }
-                    reference_papers.append(ref_paper)
-                    
-                    print(f"{i:3d}. {paper.title}")
-                    if paper.authors:
-                        author_names = [author.name for author in paper.authors[:3]]
-                        print(f"     Authors: {', '.join(author_names)}")
-                    print(f"     Year: {paper.year or 'Unknown'}")
-                    if paper.citation_count:
-                        print(f"     Citations: {paper.citation_count}")
-                    print()
-                
-                return reference_papers
-            else:
-                print("No related papers found.")
-                return []
+        return _report_papers(related_papers, "related papers", "No related papers found.")
                 
     except Exception as e:
         print(f"Error finding related papers: {e}")
         return []
 
 
+def lookup_papers(papers: List[Dict[str, Any]], paper_numbers: List[int], citations: bool,
+                  references: bool, max_papers: int = 20, max_workers: int = 4):
+    """
+    Look up citations and/or references for several papers concurrently.
+    
+    All lookups share one Google Scholar session; at most max_workers run at
+    once, and results are printed and saved in the order the papers were given.
+    """
+    titles = [papers[number - 1]['title'] for number in paper_numbers]
+    
+    with GoogleScholarScraper() as scholar:
+        def lookup(title: str):
+            citing = scholar.get_citations(title, max_papers) if citations else []
+            related = scholar.get_related_papers(title, max_papers) if references else []
+            return citing, related
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(lookup, title) for title in titles]
+            
+            for number, title, future in zip(paper_numbers, titles, futures):
+                print(f"\nPaper #{number}: {title}")
+                try:
+                    citing, related = future.result()
+                except Exception as e:
+                    print(f"Error looking up paper: {e}")
+                    continue
+                
+                found_citations = _report_papers(citing, "citing papers", "No citations found.") if citations else []
+                found_references = _report_papers(related, "related papers", "No related papers found.") if references else []
+                if found_citations or found_references:
+                    save_results(title, found_citations, found_references)
+
+
 def save_results(paper_title: str, citations: List[Dict], references: List[Dict]):
     """Save citation results to files."""
     storage = StorageManager()
     
     # Create safe filename
-    safe_title = "".join(c for c in paper_title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-    safe_title = safe_title.replace(' ', '_')[:50]
+    safe_title = safe_filename(paper_title)
     
     if citations:
         citations_file = storage.output_dir / f"{safe_title}_citations.json"
-        with open(citations_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'paper_title': paper_title,
-                'citations_count': len(citations),
-                'citations': citations
-            }, f, indent=2, ensure_ascii=False)
+        json_utils.dump_records({
+            'paper_title': paper_title,
+            'citations_count': len(citations)
+        }, 'citations', citations, citations_file)
         print(f"Citations saved to: {citations_file}")
     
     if references:
         references_file = storage.output_dir / f"{safe_title}_references.json"
-        with open(references_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'paper_title': paper_title,
-                'references_count': len(references),
-                'references': references
-            }, f, indent=2, ensure_ascii=False)
+        json_utils.dump_records({
+            'paper_title': paper_title,
+            'references_count': len(references)
+        }, 'references', references, references_file)
         print(f"References saved to: {references_file}")
 
 
 def interactive_mode(papers: List[Dict[str, Any]]):
     """Interactive mode for selecting papers."""
+    # One scraper for the whole session keeps connections and cookies warm
+    with GoogleScholarScraper() as scholar:
+        _interactive_loop(papers, scholar)
+
+
+def _interactive_loop(papers: List[Dict[str, Any]], scholar: GoogleScholarScraper):
+    """Prompt for actions until the user exits."""
     while True:
         print("\nOptions:")
         print("1. Show all papers")
@@ -179,7 +193,7 @@ def interactive_mode(papers: List[Dict[str, Any]]):
                 if 1 <= paper_num <= len(papers):
                     selected_paper = papers[paper_num - 1]
                     paper_title = selected_paper['title']
-                    citations = get_citations_for_paper(paper_title)
+                    citations = get_citations_for_paper(paper_title, scholar=scholar)
                     if citations:
                         save_results(paper_title, citations, [])
                 else:
@@ -193,7 +207,7 @@ def interactive_mode(papers: List[Dict[str, Any]]):
                 if 1 <= paper_num <= len(papers):
                     selected_paper = papers[paper_num - 1]
                     paper_title = selected_paper['title']
-                    references = get_references_for_paper(paper_title)
+                    references = get_references_for_paper(paper_title, scholar=scholar)
                     if references:
                         save_results(paper_title, [], references)
                 else:
@@ -209,6 +223,14 @@ def interactive_mode(papers: List[Dict[str, Any]]):
             print("Invalid choice! Please enter 1-4.")
 
 
+def _parse_paper_list(value: str) -> List[int]:
+    """Parse a --paper-list value such as '3,5,8'."""
+    try:
+        return [int(number) for number in value.split(',') if number.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated paper numbers, got '{value}'")
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -219,6 +241,7 @@ Examples:
   %(prog)s --file output/ICSE_2014.json
   %(prog)s --file output/ICSE_2014.json --paper 5 --citations
   %(prog)s --file output/ICSE_2014.json --paper 5 --references
+  %(prog)s --file output/ICSE_2014.json --paper-list 3,5,8 --citations
         """
     )
     
@@ -226,6 +249,8 @@ Examples:
                        help='Conference JSON file (e.g., output/ICSE_2014.json)')
     parser.add_argument('--paper', type=int, metavar='NUMBER',
                        help='Paper number to get citations/references for')
+    parser.add_argument('--paper-list', type=_parse_paper_list, metavar='N,M,...',
+                       help='Comma-separated paper numbers to look up concurrently')
     parser.add_argument('--citations', action='store_true',
                        help='Get citations for the specified paper')
     parser.add_argument('--references', action='store_true',
@@ -247,6 +272,14 @@ Examples:
     if args.list:
         list_papers_with_numbers(papers)
         
+    elif args.paper_list:
+        invalid = [number for number in args.paper_list if not 1 <= number <= len(papers)]
+        if invalid:
+            print(f"Invalid paper number(s) {invalid}! Must be between 1 and {len(papers)}")
+            sys.exit(1)
+        
+        lookup_papers(papers, args.paper_list, args.citations, args.references, args.max_papers)
+        
     elif args.paper:
         if not (1 <= args.paper <= len(papers)):
             print(f"Invalid paper number! Must be between 1 and {len(papers)}")
@@ -257,7 +290,7 @@ Examples:
         
         print(f"Selected paper #{args.paper}:")
         print(f"Title: {paper_title}")
-        print(f"Authors: {', '.join([author.get('name', '') for author in selected_paper.get('authors', [])])}")
+        print(f"Authors: {', '.join(author_names(selected_paper))}")
         print(f"Year: {selected_paper.get('year', 'Unknown')}")
         
         citations = []
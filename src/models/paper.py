@@ -2,21 +2,35 @@
 Data models for paper information.
 """
 
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-import json
 
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__, which
+# adds up when thousands of papers and authors are held in memory
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Author:
     name: str
     affiliation: Optional[str] = None
     email: Optional[str] = None
     orcid: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert author to dictionary for serialization."""
+        return {
+            'name': self.name,
+            'affiliation': self.affiliation,
+            'email': self.email,
+            'orcid': self.orcid
+        }
 
 
-@dataclass 
+@dataclass(**_DATACLASS_OPTIONS)
 class Paper:
     title: str
     authors: List[Author]
@@ -41,19 +55,16 @@ class Paper:
     metadata: Dict[str, Any] = field(default_factory=dict)
     scraped_at: datetime = field(default_factory=datetime.now)
     
+    @property
+    def identity(self) -> str:
+        """Identifier used for the paper in citation graphs: DOI, else URL, else title."""
+        return self.doi or self.url or self.title
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert paper to dictionary for serialization."""
         return {
             'title': self.title,
-            'authors': [
-                {
-                    'name': author.name,
-                    'affiliation': author.affiliation,
-                    'email': author.email,
-                    'orcid': author.orcid
-                }
-                for author in self.authors
-            ],
+            'authors': [author.to_dict() for author in self.authors],
             'abstract': self.abstract,
             'keywords': self.keywords,
             'year': self.year,
@@ -76,9 +87,23 @@ class Paper:
             'scraped_at': self.scraped_at.isoformat()
         }
     
+    def to_summary_dict(self) -> Dict[str, Any]:
+        """Convert paper to the short dictionary used for citation listings."""
+        return {
+            'title': self.title,
+            'authors': [author.name for author in self.authors],
+            'year': self.year,
+            'venue': self.venue,
+            'url': self.url,
+            'citation_count': self.citation_count,
+            'abstract': self.abstract
+        }
+    
     def to_json(self) -> str:
         """Convert paper to JSON string."""
-        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        # Imported here: src.utils imports this module
+        from src.utils import json_utils
+        return json_utils.dumps(self.to_dict(), indent=True).decode('utf-8')
     
     def to_bibtex(self) -> str:
         """Generate BibTeX entry for the paper."""
@@ -89,38 +114,38 @@ class Paper:
         entry_type = 'inproceedings' if self.venue_type == 'conference' else 'article'
         key = self._generate_bibtex_key()
         
-        bibtex = f"@{entry_type}{{{key},\n"
-        bibtex += f"  title={{{self.title}}},\n"
+        # Collect the lines and join once rather than growing a string
+        parts = [f"@{entry_type}{{{key},\n", f"  title={{{self.title}}},\n"]
         
         if self.authors:
             authors_str = ' and '.join([author.name for author in self.authors])
-            bibtex += f"  author={{{authors_str}}},\n"
+            parts.append(f"  author={{{authors_str}}},\n")
         
         if self.venue:
             venue_field = 'booktitle' if entry_type == 'inproceedings' else 'journal'
-            bibtex += f"  {venue_field}={{{self.venue}}},\n"
+            parts.append(f"  {venue_field}={{{self.venue}}},\n")
         
         if self.year:
-            bibtex += f"  year={{{self.year}}},\n"
+            parts.append(f"  year={{{self.year}}},\n")
         
         if self.pages:
-            bibtex += f"  pages={{{self.pages}}},\n"
+            parts.append(f"  pages={{{self.pages}}},\n")
         
         if self.doi:
-            bibtex += f"  doi={{{self.doi}}},\n"
+            parts.append(f"  doi={{{self.doi}}},\n")
         
         if self.url:
-            bibtex += f"  url={{{self.url}}},\n"
+            parts.append(f"  url={{{self.url}}},\n")
         
-        bibtex += "}"
-        return bibtex
+        parts.append("}")
+        return ''.join(parts)
     
     def _generate_bibtex_key(self) -> str:
         """Generate a BibTeX key for the paper."""
         if not self.authors:
             key = "unknown"
         else:
-            first_author = self.authors[0].name.split()[-1]  # Last name
+            first_author = self.authors[0].name.rsplit(None, 1)[-1]  # Last name
             key = first_author.lower()
         
         if self.year:
@@ -128,13 +153,13 @@ class Paper:
         
         # Add first word of title for uniqueness
         if self.title:
-            first_word = self.title.split()[0].lower()
+            first_word = self.title.split(None, 1)[0].lower()
             key += first_word
         
         return key
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CitationEntry:
     """Represents a citation relationship between papers."""
     citing_paper: str  # DOI or unique identifier
@@ -144,7 +169,7 @@ class CitationEntry:
     citation_type: Optional[str] = None  # supportive, critical, neutral, etc.
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CitationNetwork:
     """Represents a citation network for analysis."""
     central_paper: Paper
@@ -158,23 +183,20 @@ class CitationNetwork:
     
     def get_citation_graph(self) -> Dict[str, List[str]]:
         """Get citation relationships as adjacency list."""
-        graph = {}
+        graph = defaultdict(list)
         
         # Central paper cites references
-        central_id = self.central_paper.doi or self.central_paper.url or self.central_paper.title
-        graph[central_id] = [ref.doi or ref.url or ref.title for ref in self.references]
+        central_id = self.central_paper.identity
+        graph[central_id] = [ref.identity for ref in self.references]
         
         # Citations cite central paper
         for citation in self.citations:
-            citation_id = citation.doi or citation.url or citation.title
-            if citation_id not in graph:
-                graph[citation_id] = []
-            graph[citation_id].append(central_id)
+            graph[citation.identity].append(central_id)
         
-        return graph
+        return dict(graph)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ConferenceInfo:
     name: str
     acronym: str
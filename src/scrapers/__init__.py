@@ -1,23 +1,38 @@
 """
 Scraper module initialization and registration.
+
+Scrapers are registered with ScraperFactory in base.py. The names below are
+imported on first access (PEP 562), so importing a submodule such as
+citation_scrapers does not pull in every scraper and its dependencies.
 """
 
-from .base import ScraperFactory
-from .dblp_scraper import DBLPScraper
-from .historical_dblp_scraper import HistoricalDBLPScraper
-from .openreview_scraper import OpenReviewScraper
-from .acl_scraper import ACLScraper
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'ScraperFactory': '.base',
+    'ScraperKind': '.base',
+    'DBLPScraper': '.dblp_scraper',
+    'HistoricalDBLPScraper': '.historical_dblp_scraper',
+    'OpenReviewScraper': '.openreview_scraper',
+    'ACLScraper': '.acl_scraper',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-# Register all available scrapers
-ScraperFactory.register_scraper('dblp', HistoricalDBLPScraper)  # Use historical scraper by default
-ScraperFactory.register_scraper('dblp_basic', DBLPScraper)     # Keep basic scraper available
-ScraperFactory.register_scraper('openreview', OpenReviewScraper)
-ScraperFactory.register_scraper('anthology', ACLScraper)
 
 __all__ = [
     'ScraperFactory',
+    'ScraperKind',
     'DBLPScraper',
     'HistoricalDBLPScraper',
     'OpenReviewScraper',
     'ACLScraper'
-]
\ No newline at end of file
+]
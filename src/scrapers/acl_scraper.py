@@ -2,13 +2,54 @@
 ACL Anthology scraper for NLP conferences.
 """
 
+import copy
+import hashlib
+import io
 import json
-from typing import List, Dict, Any, Optional
-from urllib.parse import urljoin
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from lxml import etree
 
 from .base import BaseScraper
 from src.models.paper import Paper, Author, ConferenceInfo
-from config.conferences import ACL_ANTHOLOGY_CONFIG
+from src.utils.cache import DiskCache
+from src.utils.http_session import declared_encoding
+from config.conferences import ACL_ANTHOLOGY_CONFIG, SCRAPER_CONFIG
+
+_PAGES_RE = re.compile(r'pages?\s*(\d+[-–]\d+)', re.IGNORECASE)
+
+# Track of an anthology ID such as '2023.acl-long.42': the text between the
+# first '-' and the next '.' or '-'
+_TRACK_RE = re.compile(r'[^-]*-([^.-]*)')
+
+# Different conferences use different track names for main track
+_MAIN_TRACKS = frozenset(['long', 'short', 'main'])
+
+# Classes marking a paper entry <p> on an event page, and the parts of each entry
+_ENTRY_CLASSES = frozenset(['d-sm-flex', 'align-items-stretch'])
+_TITLE_LINK_XPATH = etree.XPath('(.//strong//a)[1]')
+_TITLE_XPATH = etree.XPath('(.//strong)[1]')
+_AUTHOR_XPATH = etree.XPath(".//a[contains(@href, '/people/')]")
+
+# Child-axis forms matching the anthology template (<p><span><strong><a>title
+# and <p><span><a>author), tried before the descendant forms above
+_SHALLOW_TITLE_LINK_XPATH = etree.XPath('(./span/strong/a)[1]')
+_SHALLOW_AUTHOR_XPATH = etree.XPath("./span/a[contains(@href, '/people/')]")
+
+# Plain text of an element and its descendants (iterparse yields etree
+# elements, which lack lxml.html's text_content()); plain strings keep no
+# reference back to the tree, so cleared entries can actually be freed
+_text = etree.XPath('string()', smart_strings=False)
+
+
+# Parsed event pages are reparsed from scratch after this long (seconds)
+ACL_PAGE_TTL = 30 * 24 * 3600
 
 
 class ACLScraper(BaseScraper):
@@ -17,6 +58,13 @@ class ACLScraper(BaseScraper):
     def __init__(self, conference_config: Dict[str, Any]):
         super().__init__(conference_config)
         self.acl_config = ACL_ANTHOLOGY_CONFIG
+        # Parsed event pages with their HTTP validators and body hash. Every use
+        # is revalidated against the server; the TTL just lets entries for
+        # pages nobody asks for again age out instead of living forever
+        self.page_cache = DiskCache(Path(SCRAPER_CONFIG['cache_dir']) / 'acl', ttl=ACL_PAGE_TTL)
+        self._template_drift_logged = False
+        site = urlsplit(self.acl_config['base_url'])
+        self._site_root = f"{site.scheme}://{site.netloc}"
         
     def scrape_papers(self, year: int, **kwargs) -> List[Paper]:
         """Scrape papers from ACL Anthology for a specific year."""
@@ -25,13 +73,55 @@ class ACLScraper(BaseScraper):
         # ACL Anthology uses events/venue-year format
         anthology_url = f"{self.acl_config['base_url']}/events/{venue_name}-{year}/"
         
-        response = self.get_page(anthology_url)
+        cached = self.page_cache.get(anthology_url)
+        headers = dict(self.headers)
+        if cached:
+            # Conditional GET: an unchanged page comes back as an empty 304
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = self.get_page(anthology_url, headers=headers)
         if not response:
             self.logger.warning(f"Could not fetch ACL Anthology page for {venue_name} {year}")
             return []
         
-        soup = self.parse_html(response.text)
-        return self._parse_anthology_page(soup, year)
+        body_hash = None if response.status_code == 304 else hashlib.sha256(response.content).hexdigest()
+        if cached and (response.status_code == 304 or body_hash == cached['sha256']):
+            self.logger.info(f"ACL Anthology page for {venue_name} {year} unchanged, reusing parsed papers")
+            papers = copy.deepcopy(cached['papers'])
+        else:
+            papers = self._parse_event_page(response.text, year)
+            self.page_cache.set(anthology_url, {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'sha256': body_hash,
+                'papers': copy.deepcopy(papers),
+            })
+        
+        if kwargs.get('fetch_details'):
+            self._add_paper_details(papers)
+        return papers
+    
+    def _parse_event_page(self, html: str, year: int) -> List[Paper]:
+        """Parse an event page, preferring the faster selectolax parser."""
+        # Event pages list hundreds of papers, so selectolax pays off here
+        tree = self.parse_html_fast(html)
+        if tree is not None:
+            return self._parse_anthology_tree(tree, year)
+        
+        return self._parse_anthology_page(html, year)
+    
+    def _add_paper_details(self, papers: List[Paper]):
+        """Fill in abstracts and BibTeX from each paper's detail page."""
+        papers_by_id = {paper.metadata['acl_id']: paper for paper in papers if paper.metadata.get('acl_id')}
+        
+        for paper_id, details in self.get_papers_details(list(papers_by_id)).items():
+            if details:
+                paper = papers_by_id[paper_id]
+                paper.abstract = details['abstract'] or paper.abstract
+                paper.bibtex = details['bibtex'] or paper.bibtex
     
     def scrape_conference_info(self, year: int) -> ConferenceInfo:
         """Scrape conference information from ACL Anthology."""
@@ -46,133 +136,254 @@ class ACLScraper(BaseScraper):
         
         return conference_info
     
-    def _parse_anthology_page(self, soup, year: int) -> List[Paper]:
+    def _parse_anthology_page(self, html: str, year: int) -> List[Paper]:
         """Parse ACL Anthology page to extract papers."""
-        papers = []
+        rows = []
         
-        # Look for paper entries in the anthology page
-        paper_entries = soup.find_all('p', class_='d-sm-flex align-items-stretch')
-        
-        for entry in paper_entries:
-            paper = self._parse_paper_entry(entry, year)
-            if paper:
-                papers.append(paper)
+        # Stream the page one <p> at a time and free each entry once its raw
+        # fields are extracted, so only a single entry's subtree (not the
+        # whole multi-MB DOM) stays live
+        events = etree.iterparse(io.BytesIO(html.encode('utf-8')), events=('end',), tag='p',
+                                 html=True, encoding='utf-8', recover=True)
+        try:
+            for _, element in events:
+                if _ENTRY_CLASSES <= set(element.get('class', '').split()):
+                    row = self._parse_paper_entry(element)
+                    if row:
+                        rows.append(row)
+                
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+        except etree.XMLSyntaxError:
+            # Raised for an empty document; keep whatever was parsed
+            pass
         
-        return papers
+        return self._build_papers(rows, year)
     
-    def _parse_paper_entry(self, entry, year: int) -> Optional[Paper]:
-        """Parse a single paper entry from ACL Anthology."""
+    def _parse_anthology_tree(self, tree, year: int) -> List[Paper]:
+        """Parse an ACL Anthology page already parsed by selectolax."""
+        rows = [self._parse_paper_node(node) for node in tree.css('p.d-sm-flex.align-items-stretch')]
+        return self._build_papers([row for row in rows if row], year)
+    
+    def _parse_paper_entry(self, entry) -> Optional[Tuple[str, Optional[str], List[str], str]]:
+        """
+        Extract the raw fields of a single paper entry from ACL Anthology.
+        
+        Returns (title text, title href, author names, entry text), or None
+        for an entry without a title.
+        """
         try:
-            # Extract title
-            title_elem = entry.find('strong')
-            if not title_elem:
-                return None
-            
-            title_link = title_elem.find('a')
-            if title_link:
-                title = self.clean_text(title_link.text)
-                paper_url = urljoin(self.acl_config['base_url'], title_link.get('href', ''))
+            # Title link in one lookup; the bare <strong> is only needed for
+            # entries whose title is not linked. The child-axis path covers
+            # the usual template without descending the whole entry.
+            title_links = _SHALLOW_TITLE_LINK_XPATH(entry)
+            if not title_links:
+                title_links = _TITLE_LINK_XPATH(entry)
+                if title_links:
+                    self._log_template_drift()
+            if title_links:
+                title_text, href = _text(title_links[0]), title_links[0].get('href', '')
             else:
-                title = self.clean_text(title_elem.text)
-                paper_url = None
-            
-            if not title:
-                return None
+                title_elems = _TITLE_XPATH(entry)
+                if not title_elems:
+                    return None
+                title_text, href = _text(title_elems[0]), None
             
-            # Filter for main track papers only (long and short papers)
-            if paper_url:
-                # Extract paper ID from URL to check track
-                paper_id = paper_url.rstrip('/').split('/')[-1].replace('.html', '')
-                if paper_id and '.' in paper_id and '-' in paper_id:
-                    parts = paper_id.split('-')
-                    if len(parts) >= 2:
-                        track = parts[1].split('.')[0]
-                        # Different conferences use different track names for main track
-                        main_tracks = ['long', 'short', 'main']
-                        if track not in main_tracks:
-                            # Skip non-main track papers
-                            return None
+            author_links = _SHALLOW_AUTHOR_XPATH(entry)
+            if not author_links:
+                author_links = _AUTHOR_XPATH(entry)
+                if author_links:
+                    self._log_template_drift()
+            author_names = [_text(author_link) for author_link in author_links]
             
-            # Extract authors
-            authors = []
-            author_spans = entry.find_all('a', href=lambda x: x and '/people/' in x)
+            return title_text, href, author_names, _text(entry)
             
-            for author_link in author_spans:
-                author_name = self.clean_text(author_link.text)
-                if author_name:
-                    authors.append(Author(name=author_name))
-            
-            # Extract paper ID and generate URLs
-            paper_id = None
-            if paper_url:
-                paper_id = paper_url.split('/')[-1].replace('.html', '')
-            
-            pdf_url = None
-            bibtex_url = None
-            if paper_id:
-                pdf_url = f"{self.acl_config['base_url']}/{paper_id}.pdf"
-                bibtex_url = f"{self.acl_config['api_base']}/{paper_id}"
-            
-            # Extract abstract if available (would need to fetch individual paper page)
-            abstract = None
-            
-            # Extract pages if available
-            pages = None
-            pages_text = entry.get_text()
-            if 'pages' in pages_text.lower():
-                # Try to extract page numbers using regex or text parsing
-                import re
-                page_match = re.search(r'pages?\s*(\d+[-–]\d+)', pages_text, re.IGNORECASE)
-                if page_match:
-                    pages = page_match.group(1)
+        except Exception as e:
+            self.logger.error(f"Error parsing ACL paper entry: {e}")
+            return None
+    
+    def _log_template_drift(self):
+        """Warn once when entries no longer match the expected anthology markup."""
+        if not self._template_drift_logged:
+            self._template_drift_logged = True
+            self.logger.warning("ACL Anthology entry markup differs from the expected template; "
+                                "falling back to full-depth lookups")
+    
+    def _parse_paper_node(self, node) -> Optional[Tuple[str, Optional[str], List[str], str]]:
+        """Extract the raw fields of a selectolax paper node; mirrors _parse_paper_entry."""
+        try:
+            title_link = node.css_first('strong a')
+            if title_link is not None:
+                title_text, href = title_link.text(), title_link.attributes.get('href') or ''
+            else:
+                title_elem = node.css_first('strong')
+                if title_elem is None:
+                    return None
+                title_text, href = title_elem.text(), None
             
-            paper = Paper(
-                title=title,
-                authors=authors,
-                abstract=abstract,
-                year=year,
-                venue=self.config.get('name', ''),
-                venue_type='conference',
-                url=paper_url,
-                pdf_url=pdf_url,
-                pages=pages,
-                metadata={
-                    'acl_id': paper_id,
-                    'bibtex_url': bibtex_url
-                }
-            )
+            author_names = [author_link.text() for author_link in node.css('a[href*="/people/"]')]
             
-            return paper
+            return title_text, href, author_names, node.text()
             
         except Exception as e:
             self.logger.error(f"Error parsing ACL paper entry: {e}")
             return None
     
+    def _build_papers(self, rows: List[Tuple[str, Optional[str], List[str], str]], year: int) -> List[Paper]:
+        """
+        Build Papers from the rows extracted by the traversal pass.
+        
+        Construction happens after traversal so filtered-out entries never
+        allocate Authors, and the whole page shares one timestamp.
+        """
+        scraped_at = datetime.now()
+        papers = []
+        for title_text, href, author_names, entry_text in rows:
+            try:
+                paper = self._build_paper(title_text, href, author_names, entry_text, year, scraped_at)
+            except Exception as e:
+                self.logger.error(f"Error parsing ACL paper entry: {e}")
+                continue
+            if paper:
+                papers.append(paper)
+        return papers
+    
+    def _build_paper(self, title_text: str, href: Optional[str], author_names: List[str],
+                     entry_text: str, year: int, scraped_at: Optional[datetime] = None) -> Optional[Paper]:
+        """Build a Paper from the raw fields of an anthology entry."""
+        title = self.clean_text(title_text)
+        if href is None:
+            paper_url = None
+        elif href[:1] == '/' and href[:2] != '//' and '/.' not in href:
+            # Anthology links are root-relative, so joining is a concatenation
+            paper_url = self._site_root + href
+        else:
+            paper_url = urljoin(self.acl_config['base_url'], href)
+        
+        if not title:
+            return None
+        
+        # Anthology ID from the last URL segment, e.g. '2023.acl-long.42'
+        paper_id = None
+        if paper_url:
+            paper_id = paper_url.rstrip('/').rsplit('/', 1)[-1].replace('.html', '')
+        
+        # Filter for main track papers only (long and short papers)
+        if paper_id and '.' in paper_id:
+            track_match = _TRACK_RE.match(paper_id)
+            if track_match and track_match.group(1) not in _MAIN_TRACKS:
+                # Skip non-main track papers
+                return None
+        
+        # Extract authors; names are interned so an author appearing on many
+        # papers shares one string object across all their Author records
+        authors = []
+        for author_name in author_names:
+            author_name = self.clean_text(author_name)
+            if author_name:
+                authors.append(Author(name=sys.intern(author_name)))
+        
+        pdf_url = None
+        bibtex_url = None
+        if paper_id:
+            pdf_url = f"{self.acl_config['base_url']}/{paper_id}.pdf"
+            bibtex_url = f"{self.acl_config['api_base']}/{paper_id}"
+        
+        # Extract abstract if available (would need to fetch individual paper page)
+        abstract = None
+        
+        # Extract pages if available
+        pages = None
+        # The regex runs first so the lowercased copy of the entry text is
+        # only made for entries that have page numbers at all
+        page_match = _PAGES_RE.search(entry_text)
+        if page_match and 'pages' in entry_text.lower():
+            pages = page_match.group(1)
+        
+        paper = Paper(
+            title=title,
+            authors=authors,
+            abstract=abstract,
+            year=year,
+            venue=self.config.get('name', ''),
+            venue_type='conference',
+            url=paper_url,
+            pdf_url=pdf_url,
+            pages=pages,
+            metadata={
+                'acl_id': paper_id,
+                'bibtex_url': bibtex_url
+            },
+            scraped_at=scraped_at or datetime.now()
+        )
+        
+        return paper
+    
     def get_paper_details(self, paper_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed information for a specific paper."""
-        paper_url = f"{self.acl_config['base_url']}/{paper_id}.html"
-        
-        response = self.get_page(paper_url)
+        response = self.get_page(self._paper_page_url(paper_id))
         if not response:
             return None
         
-        soup = self.parse_html(response.text)
+        return {
+            'abstract': self._parse_abstract(response.content, declared_encoding(response)),
+            'bibtex': self.get_bibtex(paper_id)
+        }
+    
+    def _paper_page_url(self, paper_id: str) -> str:
+        """URL of a paper's detail page."""
+        return f"{self.acl_config['base_url']}/{paper_id}.html"
+    
+    def _parse_abstract(self, content: bytes, encoding: Optional[str] = None) -> Optional[str]:
+        """Extract the abstract from a paper's detail page."""
+        soup = self.parse_html(content, encoding)
         
-        # Extract abstract
         abstract_elem = soup.find('div', class_='card-body acl-abstract')
-        abstract = None
         if abstract_elem:
             abstract_text = abstract_elem.find('span')
             if abstract_text:
-                abstract = self.clean_text(abstract_text.text)
+                return self.clean_text(abstract_text.text)
+        return None
+    
+    def get_papers_details(self, paper_ids: List[str], max_workers: int = 8) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get detailed information for several papers concurrently.
         
-        # Extract BibTeX
-        bibtex = self.get_bibtex(paper_id)
+        Detail pages and BibTeX entries are fetched as separate tasks, up to
+        max_workers at once over this scraper's session, so no BibTeX request
+        waits behind its paper's detail page. Papers whose detail page cannot
+        be fetched map to None, as with get_paper_details.
+        """
+        def fetch(func, paper_id: str):
+            try:
+                return func(paper_id)
+            except Exception as e:
+                self.logger.error(f"Error fetching details for {paper_id}: {e}")
+                return None
         
-        return {
-            'abstract': abstract,
-            'bibtex': bibtex
-        }
+        def get_detail_page(paper_id: str):
+            return self.get_page(self._paper_page_url(paper_id))
+        
+        details = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = [executor.submit(fetch, get_detail_page, paper_id) for paper_id in paper_ids]
+            bibtexes = [executor.submit(fetch, self.get_bibtex, paper_id) for paper_id in paper_ids]
+            
+            for paper_id, page, bibtex in zip(paper_ids, pages, bibtexes):
+                response = page.result()
+                if not response:
+                    details[paper_id] = None
+                    continue
+                try:
+                    abstract = self._parse_abstract(response.content, declared_encoding(response))
+                except Exception as e:
+                    self.logger.error(f"Error fetching details for {paper_id}: {e}")
+                    details[paper_id] = None
+                    continue
+                details[paper_id] = {'abstract': abstract, 'bibtex': bibtex.result()}
+        
+        return details
     
     def get_bibtex(self, paper_id: str) -> Optional[str]:
         """Get BibTeX citation for a paper."""
@@ -198,7 +409,7 @@ class ACLScraper(BaseScraper):
         if not response:
             return []
         
-        soup = self.parse_html(response.text)
+        soup = self.parse_html(response.content, declared_encoding(response))
         return self._parse_search_results(soup)
     
     def _parse_search_results(self, soup) -> List[Paper]:
@@ -2,38 +2,75 @@
 Base scraper architecture for paper information extraction.
 """
 
+import importlib
+import threading
 import time
 import asyncio
 import aiohttp
 import requests
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Generator
+from enum import Enum
+from typing import List, Dict, Any, Optional, Generator, Tuple, Union
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 import logging
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 from src.models.paper import Paper, Author, ConferenceInfo
+from src.utils.http_session import create_session
+from src.utils.ratelimit import AsyncTokenBucket, TokenBucket
 from config.conferences import SCRAPER_CONFIG
 
 
+# One limiter per (host, request_delay), shared by every scraper and thread in
+# the process, so concurrent scrapes of one site stay at the configured rate
+_host_limiters: Dict[Tuple[str, float], TokenBucket] = {}
+_host_limiters_lock = threading.Lock()
+
+
+def _host_limiter(url: str, request_delay: float) -> Optional[TokenBucket]:
+    """Return the process-wide limiter for url's host, or None if request_delay disables pacing."""
+    if request_delay <= 0:
+        return None
+    key = (urlparse(url).netloc, request_delay)
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(key)
+        if limiter is None:
+            limiter = _host_limiters[key] = TokenBucket(rate=1.0 / request_delay, capacity=1.0)
+        return limiter
+
+
 class BaseScraper(ABC):
     """Abstract base class for all paper scrapers."""
     
+    # Whether the scraper provides get_conference_timeline()
+    supports_timeline = False
+    
     def __init__(self, conference_config: Dict[str, Any]):
         self.config = conference_config
         self.scraper_config = SCRAPER_CONFIG
         self.session = None
+        # Optional externally owned session (see ScraperFactory.create_scraper)
+        self.shared_session = None
+        self.headers = {'User-Agent': self.scraper_config['user_agent']}
         self.logger = logging.getLogger(self.__class__.__name__)
         
     def __enter__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': self.scraper_config['user_agent']
-        })
+        if self.shared_session is not None:
+            # Headers go per request so a shared session is never mutated
+            self.session = self.shared_session
+        else:
+            # Pooled adapter so repeated requests to one host reuse keep-alive connections
+            self.session = create_session(pool_size=self.scraper_config['connection_pool_size'])
+            self.session.headers.update(self.headers)
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self.session is not self.shared_session:
             self.session.close()
     
     @abstractmethod
@@ -49,8 +86,13 @@ class BaseScraper(ABC):
     def get_page(self, url: str, **kwargs) -> Optional[requests.Response]:
         """Get a web page with error handling and rate limiting."""
         try:
-            time.sleep(self.scraper_config['request_delay'])
+            # Only waits for whatever part of the delay parsing the previous
+            # page has not already used up
+            limiter = _host_limiter(url, self.scraper_config['request_delay'])
+            if limiter is not None:
+                limiter.acquire()
             
+            kwargs.setdefault('headers', self.headers)
             response = self.session.get(
                 url,
                 timeout=self.scraper_config['timeout'],
@@ -77,9 +119,28 @@ class BaseScraper(ABC):
                 self.logger.warning(f"Attempt {attempt + 1} failed, retrying in {wait_time}s: {e}")
                 time.sleep(wait_time)
     
-    def parse_html(self, html_content: str) -> BeautifulSoup:
-        """Parse HTML content using BeautifulSoup."""
-        return BeautifulSoup(html_content, 'html.parser')
+    def parse_html(self, html_content: Union[str, bytes], encoding: Optional[str] = None) -> BeautifulSoup:
+        """
+        Parse HTML content using BeautifulSoup with the C-backed lxml parser.
+        
+        Raw response bytes are decoded with the given encoding (UTF-8 when the
+        server declares none) rather than via requests' response.text, which
+        runs charset detection on responses without a declared charset.
+        """
+        if isinstance(html_content, bytes):
+            return BeautifulSoup(html_content, 'lxml', from_encoding=encoding or 'utf-8')
+        return BeautifulSoup(html_content, 'lxml')
+    
+    def parse_html_fast(self, html_content: str) -> Optional['LexborHTMLParser']:
+        """
+        Parse HTML with selectolax for CSS-selector extraction on large pages.
+        
+        Returns None when selectolax is not installed; callers then fall back
+        to parse_html.
+        """
+        if LexborHTMLParser is None:
+            return None
+        return LexborHTMLParser(html_content)
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text content."""
@@ -103,6 +164,40 @@ class BaseScraper(ABC):
         return authors
 
 
+# aiohttp sessions shared by the AsyncBaseScrapers running on each event loop
+# (a ClientSession is bound to the loop it was created on), as
+# loop -> [session, number of scrapers currently using it]
+_async_sessions: Dict[asyncio.AbstractEventLoop, list] = {}
+
+
+async def _acquire_async_session() -> aiohttp.ClientSession:
+    """Return the running loop's shared session, creating it for the first user."""
+    loop = asyncio.get_running_loop()
+    entry = _async_sessions.get(loop)
+    if entry is None:
+        connector = aiohttp.TCPConnector(limit=128, limit_per_host=8, ttl_dns_cache=300)
+        session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=SCRAPER_CONFIG['timeout']),
+            headers={'User-Agent': SCRAPER_CONFIG['user_agent']}
+        )
+        entry = _async_sessions[loop] = [session, 0]
+    entry[1] += 1
+    return entry[0]
+
+
+async def _release_async_session():
+    """Drop one user of the running loop's shared session, closing it after the last."""
+    loop = asyncio.get_running_loop()
+    entry = _async_sessions.get(loop)
+    if entry is None:
+        return
+    entry[1] -= 1
+    if entry[1] == 0:
+        del _async_sessions[loop]
+        await entry[0].close()
+
+
 class AsyncBaseScraper(ABC):
     """Async version of base scraper for better performance."""
     
@@ -111,35 +206,58 @@ class AsyncBaseScraper(ABC):
         self.scraper_config = SCRAPER_CONFIG
         self.session = None
         self.logger = logging.getLogger(self.__class__.__name__)
+        # One token bucket per host, shared by all concurrent requests to it
+        self._limiters: Dict[str, AsyncTokenBucket] = {}
     
     async def __aenter__(self):
-        connector = aiohttp.TCPConnector(limit=10, limit_per_host=5)
-        timeout = aiohttp.ClientTimeout(total=self.scraper_config['timeout'])
-        
-        self.session = aiohttp.ClientSession(
-            connector=connector,
-            timeout=timeout,
-            headers={'User-Agent': self.scraper_config['user_agent']}
-        )
+        # Scrapers running concurrently share one connection pool and DNS cache
+        self.session = await _acquire_async_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
-            await self.session.close()
+            self.session = None
+            await _release_async_session()
     
     @abstractmethod
     async def scrape_papers_async(self, year: int, **kwargs) -> List[Paper]:
         """Async version of scrape_papers."""
         pass
     
+    def _limiter_for(self, url: str) -> AsyncTokenBucket:
+        """Get the token bucket pacing requests to the URL's host."""
+        host = urlparse(url).netloc
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = self._limiters[host] = AsyncTokenBucket(self.scraper_config['requests_per_host_per_second'])
+        return limiter
+    
     async def get_page_async(self, url: str, **kwargs) -> Optional[str]:
-        """Async version of get_page."""
+        """
+        Async version of get_page.
+        
+        Requests are paced by a per-host token bucket instead of a fixed
+        delay. 429 and 5xx responses are retried with exponential backoff,
+        which pauses the whole host so concurrent tasks back off together.
+        """
+        limiter = self._limiter_for(url)
+        max_retries = self.scraper_config['max_retries']
+        
         try:
-            await asyncio.sleep(self.scraper_config['request_delay'])
-            
-            async with self.session.get(url, **kwargs) as response:
-                response.raise_for_status()
-                return await response.text()
+            for attempt in range(max_retries):
+                await limiter.acquire()
+                
+                async with self.session.get(url, **kwargs) as response:
+                    limiter.update_from_headers(response.headers)
+                    
+                    throttled = response.status == 429 or response.status >= 500
+                    if not throttled or attempt == max_retries - 1:
+                        response.raise_for_status()
+                        return await response.text()
+                
+                wait_time = (2 ** attempt) * self.scraper_config['request_delay']
+                self.logger.warning(f"HTTP {response.status} from {url}, retrying in {wait_time}s")
+                limiter.pause(wait_time)
                 
         except aiohttp.ClientError as e:
             self.logger.error(f"Error fetching {url}: {e}")
@@ -161,28 +279,67 @@ class AsyncBaseScraper(ABC):
         return year_papers
 
 
+class ScraperKind(str, Enum):
+    """Scraper types a conference configuration's 'type' may name."""
+    DBLP = 'dblp'
+    DBLP_BASIC = 'dblp_basic'
+    OPENREVIEW = 'openreview'
+    ANTHOLOGY = 'anthology'
+
+
 class ScraperFactory:
     """Factory class for creating scrapers based on conference type."""
     
-    _scrapers = {}
+    _scrapers: Dict[ScraperKind, Union[type, str]] = {}
+    
+    @classmethod
+    def register_scraper(cls, scraper_type: Union[ScraperKind, str], scraper_class: Union[type, str]):
+        """
+        Register a scraper class for a specific type; unknown type names raise ValueError.
+        
+        scraper_class may be given as a dotted import path, in which case its
+        module is only imported the first time a scraper of that type is created.
+        """
+        cls._scrapers[ScraperKind(scraper_type)] = scraper_class
     
     @classmethod
-    def register_scraper(cls, scraper_type: str, scraper_class):
-        """Register a scraper class for a specific type."""
-        cls._scrapers[scraper_type] = scraper_class
+    def _resolve(cls, kind: ScraperKind) -> type:
+        """Return the scraper class for kind, importing it if registered by path."""
+        scraper_class = cls._scrapers[kind]
+        if isinstance(scraper_class, str):
+            module_name, _, class_name = scraper_class.rpartition('.')
+            scraper_class = getattr(importlib.import_module(module_name), class_name)
+            cls._scrapers[kind] = scraper_class
+        return scraper_class
     
     @classmethod
-    def create_scraper(cls, conference_config: Dict[str, Any]) -> BaseScraper:
-        """Create a scraper instance based on conference configuration."""
+    def create_scraper(cls, conference_config: Dict[str, Any],
+                       session: Optional[requests.Session] = None) -> BaseScraper:
+        """
+        Create a scraper instance based on conference configuration.
+        
+        If a session is given the scraper uses it instead of opening its own,
+        so connections are pooled across scrapers; the caller owns closing it.
+        """
         scraper_type = conference_config.get('type')
         
-        if scraper_type not in cls._scrapers:
-            raise ValueError(f"Unknown scraper type: {scraper_type}")
+        try:
+            scraper_class = cls._resolve(ScraperKind(scraper_type))
+        except (ValueError, KeyError):
+            raise ValueError(f"Unknown scraper type: {scraper_type}") from None
         
-        scraper_class = cls._scrapers[scraper_type]
-        return scraper_class(conference_config)
+        scraper = scraper_class(conference_config)
+        scraper.shared_session = session
+        return scraper
     
     @classmethod
     def get_available_types(cls) -> List[str]:
         """Get list of available scraper types."""
-        return list(cls._scrapers.keys())
\ No newline at end of file
+        return [kind.value for kind in cls._scrapers]
+
+
+# Built-in scrapers, registered by path so their modules load on first use
+ScraperFactory.register_scraper(ScraperKind.DBLP, 'src.scrapers.historical_dblp_scraper.HistoricalDBLPScraper')  # Use historical scraper by default
+ScraperFactory.register_scraper(ScraperKind.DBLP_BASIC, 'src.scrapers.dblp_scraper.DBLPScraper')     # Keep basic scraper available
+ScraperFactory.register_scraper(ScraperKind.OPENREVIEW, 'src.scrapers.openreview_scraper.OpenReviewScraper')
+ScraperFactory.register_scraper(ScraperKind.ANTHOLOGY, 'src.scrapers.acl_scraper.ACLScraper')
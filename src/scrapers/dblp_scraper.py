@@ -3,6 +3,7 @@ DBLP scraper for conferences indexed in DBLP database.
 """
 
 import xml.etree.ElementTree as ET
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 from urllib.parse import urljoin
 
@@ -51,8 +52,10 @@ class DBLPScraper(BaseScraper):
         try:
             root = ET.fromstring(xml_content)
             
+            # One timestamp for the whole proceedings rather than one per paper
+            scraped_at = datetime.now()
             for entry in root.findall('.//inproceedings'):
-                paper = self._parse_paper_entry(entry, year)
+                paper = self._parse_paper_entry(entry, year, scraped_at)
                 if paper:
                     papers.append(paper)
                     
@@ -61,7 +64,8 @@ class DBLPScraper(BaseScraper):
         
         return papers
     
-    def _parse_paper_entry(self, entry: ET.Element, year: int) -> Optional[Paper]:
+    def _parse_paper_entry(self, entry: ET.Element, year: int,
+                           scraped_at: Optional[datetime] = None) -> Optional[Paper]:
         """Parse a single paper entry from DBLP XML."""
         try:
             title_elem = entry.find('title')
@@ -105,7 +109,8 @@ class DBLPScraper(BaseScraper):
                 pages=pages,
                 doi=doi,
                 url=url,
-                metadata={'dblp_key': entry.get('key')}
+                metadata={'dblp_key': entry.get('key')},
+                scraped_at=scraped_at or datetime.now()
             )
             
             return paper
@@ -2,6 +2,7 @@
 Enhanced DBLP scraper that handles historical conference mappings and predecessor conferences.
 """
 
+import sys
 import xml.etree.ElementTree as ET
 from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import urljoin
@@ -15,6 +16,8 @@ from config.conference_history import get_venue_for_year, conference_exists_in_y
 class HistoricalDBLPScraper(DBLPScraper):
     """Enhanced DBLP scraper that handles historical conference mappings."""
     
+    supports_timeline = True
+    
     def __init__(self, conference_config: Dict[str, Any]):
         super().__init__(conference_config)
         # Try to get conference name from config, fallback to venue_short
@@ -24,6 +27,10 @@ class HistoricalDBLPScraper(DBLPScraper):
         if self.conference_name == 'NEURIPS':
             self.conference_name = 'NIPS'
         
+        # The upper-cased name is built at runtime; intern it so the per-year
+        # history lookups keyed on conference name hit the identity fast path
+        self.conference_name = sys.intern(self.conference_name)
+        
     def scrape_papers(self, year: int, **kwargs) -> List[Paper]:
         """Scrape papers from DBLP for a specific year, handling historical mappings."""
         
@@ -154,6 +161,11 @@ class HistoricalDBLPScraper(DBLPScraper):
                 except ValueError:
                     pass
         
+        # Years are appended in ascending order, so the bounds are the ends
+        available_years = timeline['available_years']
+        timeline['year_min'] = available_years[0] if available_years else None
+        timeline['year_max'] = available_years[-1] if available_years else None
+        
         return timeline
     
     def validate_historical_availability(self, start_year: int = 2009, end_year: int = 2024) -> Dict[int, bool]:
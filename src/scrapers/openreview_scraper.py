@@ -7,6 +7,7 @@ from typing import List, Dict, Any, Optional
 
 from .base import BaseScraper
 from src.models.paper import Paper, Author, ConferenceInfo
+from src.utils import json_utils
 from config.conferences import OPENREVIEW_CONFIG
 
 
@@ -42,7 +43,7 @@ class OpenReviewScraper(BaseScraper):
                 break
             
             try:
-                data = response.json()
+                data = json_utils.loads(response.content)
                 notes = data.get('notes', [])
                 
                 if not notes:
@@ -159,7 +160,7 @@ class OpenReviewScraper(BaseScraper):
             return []
         
         try:
-            data = response.json()
+            data = json_utils.loads(response.content)
             notes = data.get('notes', [])
             
             reviews = []
@@ -2,13 +2,17 @@
 Utility modules for paper scraping and analysis.
 """
 
-from .storage import StorageManager, DataExporter
-from .filters import PaperFilter, PaperSearcher, PaperAnalyzer
+from .storage import StorageManager, DataExporter, PaperSource
+from .filters import PaperFilter, PaperSearcher, PaperAnalyzer, InvertedIndex
+from .cache import DiskCache
 
 __all__ = [
     'StorageManager',
     'DataExporter', 
+    'PaperSource',
     'PaperFilter',
     'PaperSearcher',
-    'PaperAnalyzer'
+    'PaperAnalyzer',
+    'InvertedIndex',
+    'DiskCache'
 ]
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+Simple persistent cache for expensive network lookups.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional, Tuple
+
+
+class DiskCache:
+    """Pickle-backed key/value cache on disk with a time-to-live."""
+
+    def __init__(self, cache_dir: str = ".cache", ttl: Optional[float] = 7 * 24 * 3600,
+                 memory_size: int = 1024):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.memory_size = memory_size
+        self.logger = logging.getLogger(self.__class__.__name__)
+        # In-memory LRU layer so repeat lookups in one run skip the disk;
+        # bounded so long runs (e.g. every API response) don't grow without limit
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+    def _key_path(self, key: Hashable) -> Tuple[str, Path]:
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return digest, self.cache_dir / f"{digest}.pkl"
+
+    def _is_fresh(self, stored_at: float, ttl: Optional[float]) -> bool:
+        return ttl is None or time.time() - stored_at < ttl
+
+    def _remember(self, digest: str, entry: Tuple[float, Any]):
+        with self._memory_lock:
+            self._memory[digest] = entry
+            self._memory.move_to_end(digest)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def get(self, key: Hashable, default: Any = None, ttl: Optional[float] = None) -> Any:
+        """
+        Return the cached value for key, or default if missing or expired.
+
+        ttl overrides the cache's own time-to-live for this lookup, so one
+        cache can hold entries that go stale at different rates.
+        """
+        digest, path = self._key_path(key)
+
+        with self._memory_lock:
+            entry = self._memory.get(digest)
+            if entry is not None:
+                self._memory.move_to_end(digest)
+        if entry is None:
+            try:
+                with open(path, 'rb') as f:
+                    entry = pickle.load(f)
+            except FileNotFoundError:
+                return default
+            except Exception as e:
+                self.logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+                return default
+            self._remember(digest, entry)
+
+        stored_at, value = entry
+        if not self._is_fresh(stored_at, self.ttl if ttl is None else ttl):
+            with self._memory_lock:
+                self._memory.pop(digest, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store value under key."""
+        digest, path = self._key_path(key)
+        entry = (time.time(), value)
+        self._remember(digest, entry)
+
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a uniquely named temp file first so a crash never leaves a
+            # truncated entry and concurrent writers of one key never share a file
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, prefix=f"{digest}.", suffix=".tmp",
+                                             delete=False) as f:
+                tmp_path = f.name
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Could not write cache entry {path}: {e}")
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+
+    def clear(self):
+        """Remove all cached entries."""
+        with self._memory_lock:
+            self._memory.clear()
+        for path in self.cache_dir.glob("*.pkl"):
+            path.unlink(missing_ok=True)
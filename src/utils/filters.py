@@ -3,7 +3,9 @@ Filtering and search utilities for scraped papers.
 """
 
 import re
-from typing import List, Dict, Any, Optional, Callable
+from collections import Counter
+from functools import cached_property, reduce
+from typing import List, Dict, Any, Optional, Callable, Set
 from datetime import datetime
 
 from src.models.paper import Paper
@@ -209,49 +211,95 @@ class PaperSearcher:
         return [paper for paper, similarity in similar_papers]
 
 
+class InvertedIndex:
+    """Token -> document ids index for narrowing substring searches."""
+    
+    TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+    
+    def __init__(self, postings: Dict[str, Set[int]], size: int):
+        self.postings = postings
+        self.size = size
+    
+    @classmethod
+    def build(cls, texts: List[str]) -> 'InvertedIndex':
+        """Build an index over already-lowercased texts."""
+        postings: Dict[str, Set[int]] = {}
+        for doc_id, text in enumerate(texts):
+            for token in set(cls.TOKEN_PATTERN.findall(text)):
+                postings.setdefault(token, set()).add(doc_id)
+        return cls(postings, len(texts))
+    
+    def _postings_containing(self, fragment: str) -> Set[int]:
+        """Union of postings for every indexed token containing fragment."""
+        exact = self.postings.get(fragment)
+        matches = [ids for token, ids in self.postings.items() if fragment in token and ids is not exact]
+        if exact is not None:
+            matches.append(exact)
+        return set().union(*matches)
+    
+    def candidates(self, query: str) -> Optional[Set[int]]:
+        """
+        Return ids of documents that may contain the lowercased query as a substring.
+        
+        Every returned id still needs a substring check; None means the query
+        has no indexable tokens and every document is a candidate.
+        """
+        tokens = self.TOKEN_PATTERN.findall(query)
+        if not tokens:
+            return None
+        
+        # The first and last tokens may be cut off mid-word in a substring
+        # match, so they match any indexed token containing them; tokens in
+        # between must be whole indexed tokens
+        posting_sets = [self._postings_containing(tokens[0])]
+        if len(tokens) > 1:
+            posting_sets.append(self._postings_containing(tokens[-1]))
+        for token in tokens[1:-1]:
+            posting_sets.append(self.postings.get(token, set()))
+        
+        # Intersect starting from the smallest set
+        posting_sets.sort(key=len)
+        return reduce(set.intersection, posting_sets[1:], set(posting_sets[0]))
+
+
 class PaperAnalyzer:
     """Analyze trends and patterns in paper collections."""
     
     def __init__(self, papers: List[Paper]):
         self.papers = papers
     
+    # Counts are built once on first use (Counter counts in C) and shared by the getters
+    @cached_property
+    def _year_counts(self) -> Counter:
+        return Counter(paper.year for paper in self.papers if paper.year)
+    
+    @cached_property
+    def _venue_counts(self) -> Counter:
+        return Counter(paper.venue for paper in self.papers if paper.venue)
+    
+    @cached_property
+    def _author_counts(self) -> Counter:
+        return Counter(author.name for paper in self.papers for author in paper.authors)
+    
+    @cached_property
+    def _keyword_counts(self) -> Counter:
+        return Counter(keyword for paper in self.papers for keyword in paper.keywords)
+    
     def get_yearly_distribution(self) -> Dict[int, int]:
         """Get distribution of papers by year."""
-        distribution = {}
-        for paper in self.papers:
-            if paper.year:
-                distribution[paper.year] = distribution.get(paper.year, 0) + 1
-        return dict(sorted(distribution.items()))
+        return dict(sorted(self._year_counts.items()))
     
     def get_venue_distribution(self) -> Dict[str, int]:
         """Get distribution of papers by venue."""
-        distribution = {}
-        for paper in self.papers:
-            if paper.venue:
-                distribution[paper.venue] = distribution.get(paper.venue, 0) + 1
-        return dict(sorted(distribution.items(), key=lambda x: x[1], reverse=True))
+        return dict(self._venue_counts.most_common())
     
     def get_top_authors(self, limit: int = 10) -> List[tuple]:
         """Get top authors by number of papers."""
-        author_counts = {}
-        
-        for paper in self.papers:
-            for author in paper.authors:
-                author_counts[author.name] = author_counts.get(author.name, 0) + 1
-        
-        top_authors = sorted(author_counts.items(), key=lambda x: x[1], reverse=True)
-        return top_authors[:limit]
+        return self._author_counts.most_common(limit)
     
     def get_common_keywords(self, limit: int = 20) -> List[tuple]:
         """Get most common keywords."""
-        keyword_counts = {}
-        
-        for paper in self.papers:
-            for keyword in paper.keywords:
-                keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
-        
-        common_keywords = sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)
-        return common_keywords[:limit]
+        return self._keyword_counts.most_common(limit)
     
     def get_citation_stats(self) -> Dict[str, Any]:
         """Get citation statistics."""
@@ -0,0 +1,58 @@
+"""
+Shared, connection-pooled HTTP session for the scrapers.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session(pool_size: int = 20, retries: int = 3) -> requests.Session:
+    """
+    Create a requests session with a keep-alive pool and transient-error retries.
+
+    Only 5xx gateway/server errors and connection failures are retried here;
+    429/503 rate limiting is handled by ratelimit.get_with_backoff, which
+    honours Retry-After, so the two never stack their retries.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 504),
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def declared_encoding(response: requests.Response) -> Optional[str]:
+    """
+    Charset named in a response's Content-Type header, or None.
+
+    Unlike response.encoding this does not fall back to ISO-8859-1 for
+    text/* responses without a charset, so parsers can use their own default.
+    """
+    content_type = response.headers.get('Content-Type', '')
+    return response.encoding if 'charset=' in content_type.lower() else None
+
+
+@lru_cache(maxsize=1)
+def shared_session() -> requests.Session:
+    """
+    Process-wide session shared by every scraper so connections are reused.
+    
+    The session is used from several threads at once (concurrent years,
+    conferences and ACL detail pages). That is safe for independent GETs:
+    urllib3's connection pool is thread-safe and the cookie jar locks
+    internally. Callers must not mutate session-level state once it is
+    shared, so headers are passed per request rather than set on the session.
+    """
+    return create_session()
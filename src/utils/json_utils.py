@@ -0,0 +1,69 @@
+"""
+JSON helpers that use orjson when it is installed and fall back to the stdlib.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is strict about NaN/Infinity, which json.dump may have written
+            pass
+    return json.loads(data)
+
+
+def load_file(file_path) -> Any:
+    """Parse a JSON file."""
+    with open(file_path, 'rb') as f:
+        return loads(f.read())
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, optionally indented by two spaces."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def dump_file(obj: Any, file_path, indent: bool = False):
+    """Serialize obj to a JSON file."""
+    with open(file_path, 'wb') as f:
+        f.write(dumps(obj, indent=indent))
+
+
+def _nested(encoded: bytes, depth: int) -> bytes:
+    """Re-indent an indented JSON document for embedding depth levels deep."""
+    return encoded.replace(b'\n', b'\n' + b'  ' * depth)
+
+
+def dump_records(header: Dict[str, Any], key: str, records: Iterable[Any], file_path):
+    """
+    Write {**header, key: [records]} as indented JSON, encoding one record at a time.
+
+    The output is identical to dump_file(..., indent=True), but the encoded
+    form of the whole record list never has to be held in memory at once.
+    """
+    with open(file_path, 'wb') as f:
+        f.write(b'{\n')
+        for name, value in header.items():
+            f.write(b'  ' + dumps(name) + b': ' + _nested(dumps(value, indent=True), 1) + b',\n')
+        f.write(b'  ' + dumps(key) + b': [')
+        
+        separator = b'\n    '
+        for record in records:
+            f.write(separator + _nested(dumps(record, indent=True), 2))
+            separator = b',\n    '
+        f.write(b']\n}' if separator == b'\n    ' else b'\n  ]\n}')
@@ -0,0 +1,180 @@
+"""
+Rate-limit handling for HTTP APIs: backoff on 429/503 honouring Retry-After,
+and token-bucket pacing for concurrent threaded or async requests.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+
+# Status codes that mean "slow down and try again" rather than a hard failure
+RETRY_STATUSES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def get_with_backoff(session: requests.Session, url: str, max_attempts: int = 3,
+                     max_delay: float = 60.0, logger: Optional[logging.Logger] = None,
+                     **kwargs) -> requests.Response:
+    """
+    GET a URL, retrying rate-limited responses with exponential backoff.
+
+    The server's Retry-After header is honoured when present; otherwise the
+    wait is 2**attempt seconds plus jitter. The last response is returned
+    as-is, so callers still decide how to handle a persistent 429.
+    """
+    return request_with_backoff(session, 'GET', url, max_attempts, max_delay, logger, **kwargs)
+
+
+def request_with_backoff(session: requests.Session, method: str, url: str, max_attempts: int = 3,
+                         max_delay: float = 60.0, logger: Optional[logging.Logger] = None,
+                         **kwargs) -> requests.Response:
+    """Send a request with any HTTP method, retrying like get_with_backoff."""
+    logger = logger or logging.getLogger(__name__)
+    send = getattr(session, method.lower())
+
+    for attempt in range(max_attempts):
+        response = send(url, **kwargs)
+        if response.status_code not in RETRY_STATUSES or attempt == max_attempts - 1:
+            return response
+
+        delay = parse_retry_after(response.headers.get('Retry-After'))
+        if delay is None:
+            delay = 2 ** attempt + random.uniform(0, 2 ** attempt)
+        delay = min(delay, max_delay)
+
+        logger.warning(f"Rate limited by {url} (HTTP {response.status_code}), retrying in {delay:.1f}s")
+        response.close()
+        time.sleep(delay)
+
+    return response
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket limiter for requests sharing one host.
+
+    Allows `rate` acquisitions per second on average with bursts of up to
+    `capacity`. Each acquisition reserves its token under a lock and then
+    sleeps outside it until the token has refilled, so time already spent
+    on earlier requests counts towards the wait. `jitter` adds a random
+    extra cost of up to that many tokens per acquisition, for hosts that
+    punish evenly spaced requests.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, jitter: float = 0.0):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.jitter = jitter
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1 + (random.uniform(0, self.jitter) if self.jitter else 0)
+            return max(-self._tokens / self.rate, self._blocked_until - now)
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def pause(self, seconds: float):
+        """Hold back every acquisition for the next `seconds`."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def set_rate(self, rate: float):
+        """Change the refill rate, capped at the rate the bucket was created with."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(min(rate, self.max_rate), 1e-3)
+
+    def update_from_headers(self, headers):
+        """
+        Adapt to the limits a response advertises.
+
+        Retry-After pauses the bucket; X-RateLimit-Remaining/-Reset set the
+        rate to whatever spreads the remaining quota over the reset window.
+        """
+        delay = parse_retry_after(headers.get('Retry-After'))
+        if delay is not None:
+            self.pause(delay)
+
+        try:
+            remaining = float(headers.get('X-RateLimit-Remaining'))
+            reset = float(headers.get('X-RateLimit-Reset'))
+        except (TypeError, ValueError):
+            return
+        # Reset is either seconds from now or an epoch timestamp
+        if reset > 1e9:
+            reset -= time.time()
+        if reset > 0:
+            self.set_rate(max(remaining, 1.0) / reset)
+
+
+class AsyncTokenBucket(TokenBucket):
+    """
+    Token-bucket limiter for asyncio tasks sharing one host.
+
+    Same accounting as TokenBucket, but waiting tasks yield to the event
+    loop instead of blocking the thread.
+    """
+
+    async def acquire(self):
+        """Wait until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def __enter__(self):
+        raise TypeError("use 'async with' with AsyncTokenBucket")
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
@@ -5,11 +5,53 @@ Storage utilities for saving scraped papers in different formats.
 import json
 import csv
 import os
+import re
+from collections.abc import Sequence
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from src.models.paper import Paper, ConferenceInfo
+from . import json_utils
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Anything other than letters, digits, spaces, '-' and '_' (\w matches exactly
+# the str.isalnum() characters plus '_')
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w \-]')
+# The same filter for pure-ASCII titles, as a bytes.translate deletion table
+_UNSAFE_ASCII_BYTES = bytes(
+    byte for byte in range(128)
+    if not (chr(byte).isalnum() or chr(byte) in ' -_')
+)
+
+
+_get_name = itemgetter('name')
+
+
+def author_names(paper: Dict[str, Any]) -> List[str]:
+    """Author names of a saved paper dict, '' for any author without one."""
+    authors = paper.get('authors') or []
+    try:
+        # Saved papers always carry a name per author, so map the C-level getter
+        return list(map(_get_name, authors))
+    except KeyError:
+        return [author.get('name', '') for author in authors]
+
+
+def safe_filename(title: str, max_length: int = 50) -> str:
+    """Turn a paper title into a filesystem-safe filename stem."""
+    if title.isascii():
+        # Most titles are ASCII; deleting bytes is several times faster than re.sub
+        title = title.encode('ascii').translate(None, _UNSAFE_ASCII_BYTES).decode('ascii')
+    else:
+        title = _UNSAFE_FILENAME_CHARS.sub('', title)
+    return title.rstrip().replace(' ', '_')[:max_length]
 
 
 class StorageManager:
@@ -102,19 +144,17 @@ class StorageManager:
             f.write(f"% BibTeX entries generated on {datetime.now().isoformat()}\n")
             f.write(f"% Total papers: {len(papers)}\n\n")
             
-            for paper in papers:
-                f.write(paper.to_bibtex())
-                f.write("\n\n")
+            f.writelines(f"{paper.to_bibtex()}\n\n" for paper in papers)
     
-    def load_papers(self, file_path: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def load_papers(file_path: str) -> List[Dict[str, Any]]:
         """Load papers from JSON file."""
         file_path = Path(file_path)
         
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = json_utils.load_file(file_path)
         
         # Handle both formats: {"papers": [...]} and [...]
         if isinstance(data, list):
@@ -187,4 +227,77 @@ class DataExporter:
         except ImportError:
             # Fallback to CSV if pandas is not available
             filename = f"papers_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            return str(self.storage.save_papers(papers, filename, 'csv'))
\ No newline at end of file
+            return str(self.storage.save_papers(papers, filename, 'csv'))
+
+class PaperSource(Sequence):
+    """
+    Read-only, indexable view of the papers in a saved JSON file.
+    
+    Small files (or any file when ijson is not installed) are loaded eagerly.
+    Larger files are streamed with ijson, keeping only a window of papers
+    around the last access in memory, which suits page-by-page browsing.
+    """
+    
+    EAGER_MAX_BYTES = 5 * 1024 * 1024
+    
+    def __init__(self, file_path: str, window_size: int = 20):
+        self.file_path = Path(file_path)
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"File not found: {self.file_path}")
+        
+        self.window_size = window_size
+        self._papers = None
+        self._window_start = 0
+        self._window: List[Dict[str, Any]] = []
+        
+        if ijson is None or self.file_path.stat().st_size <= self.EAGER_MAX_BYTES:
+            self._papers = StorageManager.load_papers(self.file_path)
+            self._length = len(self._papers)
+            return
+        
+        with open(self.file_path, 'rb') as f:
+            is_list = f.read(64).lstrip()[:1] == b'['
+        self._prefix = 'item' if is_list else 'papers.item'
+        self._length = self._read_length()
+    
+    def _read_length(self) -> int:
+        """Read the paper count, from the file's total_papers header when present."""
+        if self._prefix == 'papers.item':
+            with open(self.file_path, 'rb') as f:
+                for prefix, event, value in ijson.parse(f):
+                    if prefix == 'total_papers' and event == 'number':
+                        return int(value)
+                    if prefix == 'papers':
+                        # Reached the papers array without a header; count instead
+                        break
+        
+        with open(self.file_path, 'rb') as f:
+            return sum(1 for _ in ijson.items(f, self._prefix))
+    
+    def _load_window(self, index: int):
+        """Stream the file up to index and keep the window of papers starting there."""
+        self._window_start = index
+        with open(self.file_path, 'rb') as f:
+            items = ijson.items(f, self._prefix, use_float=True)
+            self._window = list(islice(items, index, index + self.window_size))
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __getitem__(self, index):
+        if self._papers is not None:
+            return self._papers[index]
+        
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("paper index out of range")
+        
+        offset = index - self._window_start
+        if not 0 <= offset < len(self._window):
+            self._load_window(index)
+            offset = 0
+        return self._window[offset]
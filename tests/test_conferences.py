@@ -4,19 +4,24 @@ Unit tests for conference configurations and scraping functionality.
 Tests all SE conferences including the newly added ones.
 """
 
+import asyncio
 import unittest
 import sys
 import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
 # Add the project root to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config.conferences import CONFERENCES, SCRAPER_CONFIG, DBLP_CONFIG
+from config.conferences import CONFERENCES, CONFERENCE_INDEX, CONFERENCE_DOMAIN, SCRAPER_CONFIG, DBLP_CONFIG
 from src.scrapers import ScraperFactory
-from src.scrapers.base import BaseScraper
+from src.scrapers.base import AsyncBaseScraper, BaseScraper
 from src.models.paper import Paper, Author, ConferenceInfo
+from src.utils.cache import DiskCache
 
 
 class TestConferenceConfigurations(unittest.TestCase):
@@ -45,6 +50,14 @@ class TestConferenceConfigurations(unittest.TestCase):
         for conf in new_conferences:
             self.assertIn(conf, self.se_conferences, f"Conference {conf} not found in SE conferences")
     
+    def test_flat_conference_index(self):
+        """Test the flat acronym lookups agree with the nested registry."""
+        for category, conferences in CONFERENCES.items():
+            for conf_name, conf_data in conferences.items():
+                self.assertIs(CONFERENCE_INDEX[conf_name], conf_data)
+                self.assertEqual(CONFERENCE_DOMAIN[conf_name], category)
+        self.assertEqual(len(CONFERENCE_INDEX), sum(len(c) for c in CONFERENCES.values()))
+    
     def test_conference_structure(self):
         """Test that each conference has required fields."""
         base_required_fields = {'name', 'base_url', 'type', 'venue_key', 'venue_short'}
@@ -178,6 +191,54 @@ class TestScraperFactory(unittest.TestCase):
                 scraper = ScraperFactory.create_scraper(config)
                 self.assertIsInstance(scraper, BaseScraper)
                 self.assertEqual(scraper.config, config)
+    
+    def test_supports_timeline_flag(self):
+        """Test that only scrapers with a conference timeline advertise it."""
+        dblp_scraper = ScraperFactory.create_scraper(CONFERENCES['SE']['ICSE'])
+        self.assertTrue(dblp_scraper.supports_timeline)
+        self.assertTrue(hasattr(dblp_scraper, 'get_conference_timeline'))
+        
+        acl_scraper = ScraperFactory.create_scraper(CONFERENCES['NLP']['ACL'])
+        self.assertFalse(acl_scraper.supports_timeline)
+        self.assertFalse(hasattr(acl_scraper, 'get_conference_timeline'))
+    
+    def test_shared_session_is_reused_and_left_open(self):
+        """Test scrapers given a shared session use it and don't close it."""
+        session = MagicMock()
+        for conf_name in ('ICSE', 'MSR'):
+            scraper = ScraperFactory.create_scraper(CONFERENCES['SE'][conf_name], session=session)
+            with scraper as s:
+                self.assertIs(s.session, session)
+        session.close.assert_not_called()
+        session.headers.update.assert_not_called()
+    
+    def test_owned_session_pools_connections(self):
+        """Test a scraper's own session mounts a keep-alive pool of the configured size."""
+        scraper = ScraperFactory.create_scraper(CONFERENCES['SE']['ICSE'])
+        with scraper as s:
+            adapter = s.session.get_adapter('https://dblp.org')
+            self.assertEqual(adapter._pool_maxsize, SCRAPER_CONFIG['connection_pool_size'])
+            self.assertEqual(s.session.headers['Connection'], 'keep-alive')
+
+
+class TestAsyncBaseScraper(unittest.TestCase):
+    """Test the async scraper base class."""
+    
+    class _Scraper(AsyncBaseScraper):
+        async def scrape_papers_async(self, year, **kwargs):
+            return []
+    
+    def test_concurrent_scrapers_share_one_session(self):
+        """Test scrapers on one loop share a session that closes after the last exits."""
+        async def run():
+            async with self._Scraper(CONFERENCES['NLP']['ACL']) as first:
+                async with self._Scraper(CONFERENCES['AI_ML']['ICLR']) as second:
+                    self.assertIs(first.session, second.session)
+                    session = first.session
+                self.assertFalse(session.closed)
+            self.assertTrue(session.closed)
+        
+        asyncio.run(run())
 
 
 class TestBaseScraper(unittest.TestCase):
@@ -237,6 +298,136 @@ class TestBaseScraper(unittest.TestCase):
                 self.assertEqual(actual_names, expected_names)
 
 
+class TestACLAnthologyParsing(unittest.TestCase):
+    """Test ACL Anthology event page parsing."""
+    
+    EVENT_PAGE = """<html><body>
+    <p class="d-sm-flex align-items-stretch"><span class="d-block"><strong>
+      <a class="align-middle" href="/2023.acl-long.1/">A   Long &amp; Winding Paper</a></strong><br>
+      <a href="/people/a/alice/">Alice  A</a> | <a href="/people/b/bob/">Bob B</a> pages 1–12</span></p>
+    <p class="d-sm-flex align-items-stretch"><span class="d-block"><strong>
+      <a href="/2023.acl-demo.2/">A Demo Paper</a></strong></span></p>
+    <p class="d-sm-flex align-items-stretch"><span class="d-block"><strong>Unlinked Title</strong>
+      <a href="/people/c/carol/">Carol C</a></span></p>
+    </body></html>"""
+    
+    def setUp(self):
+        self.scraper = ScraperFactory.create_scraper(CONFERENCES['NLP']['ACL'])
+    
+    @staticmethod
+    def _fields(papers):
+        return [(p.title, [a.name for a in p.authors], p.url, p.pages, p.metadata) for p in papers]
+    
+    def test_lxml_parse(self):
+        """Test main-track entries are kept and demo entries skipped."""
+        papers = self.scraper._parse_anthology_page(self.EVENT_PAGE, 2023)
+        self.assertEqual([p.title for p in papers], ['A Long & Winding Paper', 'Unlinked Title'])
+        self.assertEqual([a.name for a in papers[0].authors], ['Alice A', 'Bob B'])
+        self.assertEqual(papers[0].pages, '1–12')
+        self.assertEqual(papers[0].metadata['acl_id'], '2023.acl-long.1')
+        self.assertEqual(papers[0].pdf_url, 'https://aclanthology.org/2023.acl-long.1.pdf')
+    
+    def test_selectolax_parse_matches_lxml(self):
+        """Test the selectolax fast path extracts exactly the same papers."""
+        tree = self.scraper.parse_html_fast(self.EVENT_PAGE)
+        if tree is None:
+            self.skipTest("selectolax not installed")
+        
+        self.assertEqual(
+            self._fields(self.scraper._parse_anthology_tree(tree, 2023)),
+            self._fields(self.scraper._parse_anthology_page(self.EVENT_PAGE, 2023))
+        )
+    
+    def test_event_page_cache_is_anchored_and_expires(self):
+        """Test the page cache lives under the configured cache root, not the CWD, and has a TTL."""
+        cache_dir = self.scraper.page_cache.cache_dir
+        self.assertTrue(cache_dir.is_absolute())
+        self.assertEqual(cache_dir.parent, Path(SCRAPER_CONFIG['cache_dir']))
+        self.assertIsNotNone(self.scraper.page_cache.ttl)
+    
+    def test_unchanged_event_page_is_not_reparsed(self):
+        """Test a 304 on revalidation reuses the papers parsed on the first fetch."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.scraper.page_cache = DiskCache(tmp_dir, ttl=None)
+            first = Mock(status_code=200, headers={'ETag': '"v1"'}, text=self.EVENT_PAGE,
+                         content=self.EVENT_PAGE.encode('utf-8'))
+            not_modified = Mock(status_code=304, headers={}, text='', content=b'')
+            
+            with patch.object(self.scraper, 'get_page', side_effect=[first, not_modified]) as get_page:
+                fresh = self.scraper.scrape_papers(2023)
+                with patch.object(self.scraper, '_parse_event_page') as parse:
+                    cached = self.scraper.scrape_papers(2023)
+            
+            parse.assert_not_called()
+            self.assertEqual(get_page.call_args.kwargs['headers']['If-None-Match'], '"v1"')
+            self.assertEqual(self._fields(cached), self._fields(fresh))
+            self.assertIsNot(cached[0], fresh[0])
+    
+    def test_papers_details_fetch_pages_and_bibtex(self):
+        """Test batched details pair each abstract with its BibTeX and drop missing pages."""
+        detail_page = '<div class="card-body acl-abstract"><span>An  abstract.</span></div>'
+        
+        def get_page(url):
+            if url.endswith('2023.acl-long.2.html'):
+                return None
+            text = detail_page if url.endswith('.html') else f"@inproceedings{{{url.rsplit('/', 1)[-1]}}}"
+            return Mock(text=text, content=text.encode('utf-8'), headers={}, encoding=None)
+        
+        with patch.object(self.scraper, 'get_page', side_effect=get_page):
+            details = self.scraper.get_papers_details(['2023.acl-long.1', '2023.acl-long.2'])
+        
+        self.assertEqual(details, {
+            '2023.acl-long.1': {'abstract': 'An abstract.', 'bibtex': '@inproceedings{2023.acl-long.1}'},
+            '2023.acl-long.2': None,
+        })
+    
+    @patch.dict(SCRAPER_CONFIG, {'request_delay': 0.05})
+    def test_concurrent_requests_are_spaced_by_request_delay(self):
+        """Test get_page calls from the detail-page worker threads never burst."""
+        delay = SCRAPER_CONFIG['request_delay']
+        scraper = ScraperFactory.create_scraper(CONFERENCES['NLP']['ACL'])
+        sent = []
+        scraper.session = Mock()
+        scraper.session.get.side_effect = lambda url, **kwargs: sent.append(time.monotonic()) or Mock()
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(scraper.get_page, [f'https://aclanthology.org/{i}' for i in range(4)]))
+        
+        sent.sort()
+        gaps = [later - earlier for earlier, later in zip(sent, sent[1:])]
+        self.assertEqual(len(gaps), 3)
+        for gap in gaps:
+            self.assertGreaterEqual(gap, delay * 0.9)
+    
+    @patch.dict(SCRAPER_CONFIG, {'request_delay': 0.04})
+    def test_scrapers_share_per_host_pacing(self):
+        """Test separate scrapers hitting one host (e.g. concurrent conferences) share its rate."""
+        delay = SCRAPER_CONFIG['request_delay']
+        scrapers = [ScraperFactory.create_scraper(CONFERENCES['SE'][name]) for name in ('ICSE', 'MSR', 'ASE')]
+        sent = []
+        for scraper in scrapers:
+            scraper.session = Mock()
+            scraper.session.get.side_effect = lambda url, **kwargs: sent.append(time.monotonic()) or Mock()
+        
+        with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+            list(executor.map(lambda scraper: scraper.get_page('https://dblp.org/db/conf/icse/'), scrapers))
+        
+        sent.sort()
+        for earlier, later in zip(sent, sent[1:]):
+            self.assertGreaterEqual(later - earlier, delay * 0.9)
+    
+    @patch.dict(SCRAPER_CONFIG, {'request_delay': 0})
+    def test_zero_request_delay_disables_pacing(self):
+        """Test request_delay 0 still means no delay between requests."""
+        scraper = ScraperFactory.create_scraper(CONFERENCES['NLP']['ACL'])
+        scraper.session = Mock()
+        
+        with patch('src.utils.ratelimit.time.sleep') as sleep:
+            for _ in range(3):
+                self.assertIsNotNone(scraper.get_page('https://aclanthology.org/'))
+        sleep.assert_not_called()
+
+
 class TestPaperModel(unittest.TestCase):
     """Test paper data model."""
     
@@ -15,7 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.conferences import CONFERENCES
 from config.conference_history import (
-    CONFERENCE_HISTORY, CONFERENCE_GAPS, HISTORICAL_MIN_PAPERS,
+    CONFERENCE_HISTORY, CONFERENCE_GAPS, HISTORICAL_MIN_PAPERS, ALL_CONFERENCES_SET,
     get_venue_for_year, get_expected_min_papers, conference_exists_in_year,
     get_all_test_years, get_all_conferences, get_predecessor_conferences
 )
@@ -100,6 +100,11 @@ class TestConferenceHistory(unittest.TestCase):
             with self.subTest(conference=conference):
                 actual_predecessors = get_predecessor_conferences(conference)
                 self.assertEqual(set(actual_predecessors), set(expected_predecessors))
+    
+    def test_all_conferences_set_matches_list(self):
+        """Test that the membership set mirrors get_all_conferences()."""
+        self.assertIsInstance(ALL_CONFERENCES_SET, frozenset)
+        self.assertEqual(ALL_CONFERENCES_SET, set(get_all_conferences()))
 
 
 class TestHistoricalDBLPScraper(unittest.TestCase):
@@ -133,6 +138,10 @@ class TestHistoricalDBLPScraper(unittest.TestCase):
         # Should have mappings for recent years
         self.assertIn(2023, timeline['year_mappings'])
         self.assertIn(2015, timeline['year_mappings'])  # SANER started in 2015
+        
+        # Year bounds are precomputed alongside the available years
+        self.assertEqual(timeline['year_min'], 2015)
+        self.assertEqual(timeline['year_max'], 2024)
     
     def test_conference_timeline_icsme(self):
         """Test ICSME conference timeline."""
@@ -364,6 +373,28 @@ class TestHistoricalDataValidation(unittest.TestCase):
                 self.assertGreaterEqual(recent_min, early_min, 
                                       f"{conference} minimums should increase over time")
     
+    def test_expected_paper_counts_range_boundaries(self):
+        """Test that every year in a configured range maps to that range's minimum."""
+        for conference, ranges in HISTORICAL_MIN_PAPERS.items():
+            for (start_year, end_year), min_papers in ranges.items():
+                with self.subTest(conference=conference, years=(start_year, end_year)):
+                    self.assertEqual(get_expected_min_papers(conference, start_year), min_papers)
+                    self.assertEqual(get_expected_min_papers(conference, end_year), min_papers)
+        
+        # Years and conferences outside the table fall back to the default
+        self.assertEqual(get_expected_min_papers('ICLR', 2010), 5)
+        self.assertEqual(get_expected_min_papers('ICSE', 2030), 5)
+        self.assertEqual(get_expected_min_papers('UNKNOWN', 2020), 5)
+    
+    def test_history_tables_are_read_only(self):
+        """Test the history tables can't be mutated at any level, so derived lookups can't go stale."""
+        with self.assertRaises(TypeError):
+            CONFERENCE_HISTORY['ICSE'] = ()
+        with self.assertRaises(AttributeError):
+            CONFERENCE_HISTORY['ICSE'].append(None)
+        with self.assertRaises(TypeError):
+            HISTORICAL_MIN_PAPERS['ICSE'][(2009, 2014)] = 0
+    
     def test_predecessor_conference_years(self):
         """Test that predecessor conferences work for historical years."""
         test_cases = [
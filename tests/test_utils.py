@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared utility helpers.
+"""
+
+import asyncio
+import json
+import unittest
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, Mock, patch
+from pathlib import Path
+
+# Add the project root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.cache import DiskCache
+from src.utils.filters import InvertedIndex
+from src.utils.http_session import create_session
+from src.utils import json_utils
+from src.utils.storage import PaperSource, safe_filename
+from src.utils import storage
+from src.utils.ratelimit import AsyncTokenBucket, TokenBucket, get_with_backoff, parse_retry_after
+from src.scrapers import citation_scrapers
+from src.scrapers.citation_scrapers import (CitationAggregator, GoogleScholarScraper, SemanticScholarScraper,
+                                            _best_title_match, _is_title_match)
+from src.models.paper import Paper, Author
+
+
+class TestDiskCache(unittest.TestCase):
+    """Test the persistent TTL cache."""
+
+    def setUp(self):
+        """Set up a cache in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = DiskCache(self.tmp_dir.name, ttl=60)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_round_trip_across_instances(self):
+        """Test values persist on disk between cache instances."""
+        self.cache.set(('title', 50, True), {'papers': [1, 2, 3]})
+
+        reopened = DiskCache(self.tmp_dir.name, ttl=60)
+        self.assertEqual(reopened.get(('title', 50, True)), {'papers': [1, 2, 3]})
+        self.assertIsNone(reopened.get(('other', 50, True)))
+
+    def test_expired_entries_are_ignored(self):
+        """Test entries older than the TTL are treated as missing."""
+        self.cache.set('key', 'value')
+
+        with patch('src.utils.cache.time.time', return_value=10**12):
+            self.assertEqual(self.cache.get('key', 'missing'), 'missing')
+
+    def test_memory_layer_is_bounded(self):
+        """Test the in-memory layer evicts least recently used entries but disk keeps them."""
+        cache = DiskCache(self.tmp_dir.name, ttl=60, memory_size=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        self.assertEqual(len(cache._memory), 2)
+        self.assertEqual(cache.get('b'), 2)
+
+    def test_concurrent_writes_of_one_key(self):
+        """Test threads writing the same key never collide on a temp file."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda i: self.cache.set('shared', i), range(64)))
+
+        self.assertIn(DiskCache(self.tmp_dir.name, ttl=60).get('shared'), range(64))
+        self.assertEqual(list(Path(self.tmp_dir.name).glob('*.tmp')), [])
+
+    def test_aggregator_uses_cache(self):
+        """Test a cached citation lookup skips the network sources."""
+        paper = Paper(title="Cached Paper", authors=[Author(name="A. Author")], venue="ICSE", year=2023)
+        aggregator = CitationAggregator(cache=self.cache)
+
+        with patch.object(aggregator, '_fetch_paper_citations', return_value=(paper, [], [])) as fetch:
+            first = aggregator.find_paper_citations("Cached  Paper", 10, False)
+            second = aggregator.find_paper_citations("cached paper ", 10, False)
+
+        fetch.assert_called_once()
+        self.assertEqual(first[0].title, second[0].title)
+
+    def test_api_responses_are_cached_per_endpoint(self):
+        """Test repeat API calls are served from the cache unless refreshing or stale."""
+        scraper = SemanticScholarScraper(cache=self.cache)
+        response = Mock(content=b'{"data": [{"citingPaper": {"title": "Citing Paper", "paperId": "c1"}}]}')
+
+        with patch.object(scraper, 'get_page', return_value=response) as get_page:
+            first = scraper.get_paper_citations('p1')
+            second = scraper.get_paper_citations('p1')
+            self.assertEqual(get_page.call_count, 1)
+            self.assertEqual([p.title for p in second], [p.title for p in first])
+
+            scraper.refresh = True
+            scraper.get_paper_citations('p1')
+            self.assertEqual(get_page.call_count, 2)
+
+            # Entries expire once the endpoint's TTL has passed
+            scraper.refresh = False
+            with patch('src.utils.cache.time.time', return_value=10**12):
+                scraper.get_paper_citations('p1')
+            self.assertEqual(get_page.call_count, 3)
+
+    def test_citations_follow_pagination(self):
+        """Test listings longer than one page are fetched page by page up to the limit."""
+        scraper = SemanticScholarScraper()
+        pages = [Mock(content=b'{"next": 1000, "data": [{"citingPaper": {"title": "First"}}]}'),
+                 Mock(content=b'{"data": [{"citingPaper": {"title": "Second"}}]}')]
+
+        with patch.object(scraper, 'get_page', side_effect=pages) as get_page:
+            papers = scraper.get_paper_citations('p1', limit=1500, fields='title')
+
+        self.assertEqual([p.title for p in papers], ["First", "Second"])
+        self.assertEqual(get_page.call_args_list[1].kwargs['params'],
+                         {'limit': 500, 'fields': 'title', 'offset': 1000})
+
+    def test_papers_batch_only_requests_uncached_ids(self):
+        """Test batch lookups POST the uncached IDs once and skip unknown ones."""
+        scraper = SemanticScholarScraper(cache=self.cache)
+        response = Mock(content=b'[{"paperId": "a", "title": "Paper A"}, null]')
+
+        with patch.object(scraper, 'post_page', return_value=response) as post_page:
+            papers = scraper.get_papers_batch(['a', 'b'], fields='paperId,title')
+            self.assertEqual([p.title for p in papers], ["Paper A"])
+            self.assertEqual(post_page.call_args.kwargs['json'], {'ids': ['a', 'b']})
+
+            scraper.get_papers_batch(['a', 'b'], fields='paperId,title')
+            self.assertEqual(post_page.call_args.kwargs['json'], {'ids': ['b']})
+
+    @patch('src.scrapers.citation_scrapers.fuzz', None)
+    def test_word_overlap_size_bound_follows_threshold(self):
+        """Test the set-size prefilter keeps matches exactly at the Jaccard threshold and rejects ones below."""
+        query = "deep learning for code search"
+        cases = [
+            (0.8, "deep learning for code", True),                          # 4/5
+            (0.8, "deep learning code", False),                             # 3/5
+            (0.8, "deep learning for code search engines", True),           # 5/6
+            (0.8, "deep learning for code search engines today", False),    # 5/7
+            (0.5, "code search", False),                                    # 2/5
+            (0.4, "code search", True),                                     # 2/5
+            (0.5, "deep learning for code search at very large scale", True),  # 5/9
+        ]
+        for threshold, result, expected in cases:
+            with self.subTest(threshold=threshold, result=result):
+                self.assertEqual(_is_title_match(query, result, threshold), expected)
+
+    def _assert_subset_titles_rejected(self):
+        query = "Deep Learning for Code Search"
+        for shorter, longer in [("Code Search", query), (query, query + " at Very Large Scale")]:
+            with self.subTest(query=shorter, result=longer):
+                self.assertFalse(_is_title_match(shorter, longer))
+                self.assertFalse(_is_title_match(longer, shorter))
+                self.assertIsNone(_best_title_match(shorter, [longer]))
+
+    @patch('src.scrapers.citation_scrapers.process', None)
+    @patch('src.scrapers.citation_scrapers.fuzz', None)
+    def test_subset_title_is_rejected_by_word_overlap(self):
+        """Test a title whose words are a subset of the other's is not a match without rapidfuzz."""
+        self._assert_subset_titles_rejected()
+
+    @unittest.skipIf(citation_scrapers.fuzz is None, "rapidfuzz not installed")
+    def test_subset_title_is_rejected_by_rapidfuzz(self):
+        """Test rapidfuzz scoring rejects subset titles just like the word-overlap fallback."""
+        self._assert_subset_titles_rejected()
+
+    def test_search_prefers_matching_title(self):
+        """Test title search returns the matching result rather than the top hit."""
+        scraper = SemanticScholarScraper()
+        response = Mock(content=b'{"data": [{"title": "A Survey of Transformers"}, '
+                                b'{"title": "Attention Is All You Need"}]}')
+
+        with patch.object(scraper, 'get_page', return_value=response):
+            paper = scraper.search_paper_by_title("attention is all you need")
+
+        self.assertEqual(paper['title'], "Attention Is All You Need")
+
+    def test_aggregator_falls_back_to_crossref(self):
+        """Test the concurrently fetched CrossRef match is used when Semantic Scholar finds nothing."""
+        aggregator = CitationAggregator(cache=self.cache)
+
+        with patch.object(aggregator.semantic_scholar, 'search_paper_by_title', return_value=None), \
+             patch.object(aggregator.crossref, 'search_paper_by_title',
+                          return_value={'title': ['CrossRef Paper'], 'DOI': '10.1/x'}) as crossref:
+            central, citations, references = aggregator.find_paper_citations("CrossRef Paper", 10, False)
+
+        crossref.assert_called_once_with("CrossRef Paper")
+        self.assertEqual((central.title, central.doi), ('CrossRef Paper', '10.1/x'))
+        self.assertEqual((citations, references), ([], []))
+
+    def test_sync_lookup_inside_running_event_loop(self):
+        """Test the synchronous API also works when called from a running event loop."""
+        aggregator = CitationAggregator(cache=self.cache)
+
+        async def lookup():
+            return aggregator.find_paper_citations("CrossRef Paper", 10, False)
+
+        with patch.object(aggregator.semantic_scholar, 'search_paper_by_title', return_value=None), \
+             patch.object(aggregator.crossref, 'search_paper_by_title',
+                          return_value={'title': ['CrossRef Paper'], 'DOI': '10.1/x'}):
+            central, _, _ = asyncio.run(lookup())
+
+        self.assertEqual(central.doi, '10.1/x')
+
+    def test_aggregator_merges_duplicate_citations(self):
+        """Test a citation found by both Semantic Scholar and Google Scholar is returned once."""
+        aggregator = CitationAggregator(cache=self.cache)
+        ss_citation = Paper(title="Shared Paper", authors=[], year=2020,
+                            metadata={'source': 'semantic_scholar'})
+        gs_citations = [Paper(title="Shared paper!", authors=[], year=2020, metadata={'source': 'google_scholar'}),
+                        Paper(title="Other Paper", authors=[], year=2021, metadata={'source': 'google_scholar'})]
+
+        with patch.object(aggregator.semantic_scholar, 'search_paper_by_title',
+                          return_value={'paperId': 'p1', 'title': "Central"}), \
+             patch.object(aggregator.semantic_scholar, 'get_paper_citations', return_value=[ss_citation]), \
+             patch.object(aggregator.semantic_scholar, 'get_paper_references', return_value=[]), \
+             patch.object(aggregator.crossref, 'search_paper_by_title', return_value=None), \
+             patch.object(aggregator.google_scholar, 'search_paper_by_title', return_value=None), \
+             patch.object(aggregator.google_scholar, 'get_citations', return_value=gs_citations), \
+             patch.object(aggregator.google_scholar, 'get_related_papers', return_value=[]):
+            _, citations, _ = aggregator.find_paper_citations("Central", 10, True)
+
+        self.assertEqual([p.title for p in citations], ["Shared Paper", "Other Paper"])
+        self.assertEqual(citations[0].metadata['sources'], ['google_scholar', 'semantic_scholar'])
+
+
+class TestGoogleScholarParsing(unittest.TestCase):
+    """Test parsing of Google Scholar result pages."""
+
+    RESULTS_PAGE = """<html><body>
+    <div class="gs_r gs_or gs_scl"><h3 class="gs_rt"><span>[PDF]</span> <a href="/paper1">Deep Code Search</a></h3>
+      <div class="gs_a">X Gu, H Zhang, S Kim - ICSE, 2018 - ieeexplore.ieee.org</div>
+      <div class="gs_rs">Searching  code is common.</div>
+      <a href="/scholar?cites=42">Cited by 512</a> <a href="/scholar?q=related:1">Related articles</a></div>
+    <div class="gs_r gs_or gs_scl"><a class="gs_rt" href="https://example.org/p2">Untitled <b>Work</b></a></div>
+    </body></html>"""
+
+    def _parse(self, page):
+        scraper = GoogleScholarScraper()
+        results = [scraper._parse_scholar_result(node) for node in scraper._result_nodes(page)]
+        for result in results:
+            result['authors'] = [author.name for author in result['authors']]
+        first = scraper._result_nodes(page)[0]
+        return results, scraper._extract_citation_link(first), scraper._is_blocked(page)
+
+    def test_parse_results(self):
+        """Test titles, metadata and the citation link are extracted."""
+        results, cite_link, blocked = self._parse(GoogleScholarScraper().parse_html(self.RESULTS_PAGE.encode('utf-8')))
+
+        self.assertEqual([r['title'] for r in results], ['Deep Code Search', 'UntitledWork'])
+        self.assertEqual(results[0]['url'], 'https://scholar.google.com/paper1')
+        self.assertEqual(results[0]['authors'], ['X Gu', 'H Zhang', 'S Kim'])
+        self.assertEqual((results[0]['year'], results[0]['citation_count']), (2018, 512))
+        self.assertEqual(results[1]['url'], 'https://example.org/p2')
+        self.assertEqual(cite_link, 'https://scholar.google.com/scholar?cites=42')
+        self.assertFalse(blocked)
+
+    def test_beautifulsoup_fallback_matches(self):
+        """Test the BeautifulSoup fallback parses exactly like selectolax."""
+        with patch('src.scrapers.citation_scrapers.LexborHTMLParser', None):
+            fallback = self._parse(GoogleScholarScraper().parse_html(self.RESULTS_PAGE.encode('utf-8')))
+        self.assertEqual(fallback, self._parse(GoogleScholarScraper().parse_html(self.RESULTS_PAGE)))
+
+
+class TestInvertedIndex(unittest.TestCase):
+    """Test the search index used by search_papers."""
+
+    def test_candidates_cover_all_substring_matches(self):
+        """Test the index never drops a document the substring scan would match."""
+        texts = [
+            "deep learning for code\nwe study neural networks.",
+            "fuzzing compilers\n",
+            "learning-based program repair\nneural repair of code",
+        ]
+        index = InvertedIndex.build(texts)
+
+        for query in ["learning", "earn", "neural net", "ep learning for co", "repair of", "zzing", "missing"]:
+            with self.subTest(query=query):
+                expected = {i for i, text in enumerate(texts) if query in text}
+                self.assertTrue(expected <= index.candidates(query))
+
+        self.assertEqual(index.candidates("missing"), set())
+        self.assertIsNone(index.candidates("--"))
+
+
+class TestJsonUtils(unittest.TestCase):
+    """Test the orjson/stdlib JSON helpers."""
+
+    def test_loads_accepts_stdlib_output(self):
+        """Test documents written by json.dump, including NaN, still parse."""
+        self.assertEqual(json_utils.loads(b'{"papers": [{"title": "A"}]}'), {'papers': [{'title': 'A'}]})
+        self.assertEqual(json_utils.loads('[1, 2]'), [1, 2])
+        self.assertNotEqual(json_utils.loads('[NaN]')[0], json_utils.loads('[NaN]')[0])
+
+    def test_dumps_matches_stdlib_indent(self):
+        """Test indented output matches json.dumps(indent=2, ensure_ascii=False) with or without orjson."""
+        data = {'title': 'Ünïcödé', 'authors': ['A', 'B'], 'year': 2023, 'search_urls': {}, 'doi': None}
+        expected = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+        self.assertEqual(json_utils.dumps(data, indent=True), expected)
+        with patch.object(json_utils, 'orjson', None):
+            self.assertEqual(json_utils.dumps(data, indent=True), expected)
+
+    def test_dump_records_matches_dump_file(self):
+        """Test record-at-a-time output is identical to dumping the whole document."""
+        header = {'paper_title': 'Ünïcödé', 'citations_count': 2}
+        for records in ([], [{'title': 'A\nB', 'authors': ['X'], 'year': None}, {}]):
+            with self.subTest(records=records), tempfile.TemporaryDirectory() as tmp_dir:
+                streamed, whole = Path(tmp_dir) / 'streamed.json', Path(tmp_dir) / 'whole.json'
+                json_utils.dump_records(header, 'citations', iter(records), streamed)
+                json_utils.dump_file({**header, 'citations': records}, whole, indent=True)
+                self.assertEqual(streamed.read_bytes(), whole.read_bytes())
+
+
+class TestRateLimitBackoff(unittest.TestCase):
+    """Test retrying of rate-limited HTTP responses."""
+
+    def _response(self, status, headers=None):
+        return Mock(status_code=status, headers=headers or {})
+
+    def test_parse_retry_after(self):
+        """Test both Retry-After forms are understood."""
+        self.assertEqual(parse_retry_after('7'), 7.0)
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after('soon'))
+
+    @patch('src.utils.ratelimit.time.sleep')
+    def test_retries_429_honouring_retry_after(self, sleep):
+        """Test a 429 is retried after the server-requested delay."""
+        ok = self._response(200)
+        session = Mock()
+        session.get.side_effect = [self._response(429, {'Retry-After': '3'}), ok]
+
+        self.assertIs(get_with_backoff(session, 'https://api.example.org', timeout=5), ok)
+        sleep.assert_called_once_with(3.0)
+        session.get.assert_called_with('https://api.example.org', timeout=5)
+
+    @patch('src.utils.ratelimit.time.sleep')
+    def test_gives_up_after_max_attempts(self, sleep):
+        """Test the last rate-limited response is returned once attempts run out."""
+        session = Mock()
+        session.get.return_value = self._response(503)
+
+        response = get_with_backoff(session, 'https://api.example.org', max_attempts=3)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(session.get.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test per-host pacing of threaded and async requests."""
+
+    @patch('src.utils.ratelimit.asyncio.sleep', new_callable=AsyncMock)
+    @patch('src.utils.ratelimit.time.monotonic', return_value=100.0)
+    def test_bursts_then_paces_and_honours_retry_after(self, monotonic, sleep):
+        """Test a full bucket allows a burst, then waits for refills and Retry-After."""
+        bucket = AsyncTokenBucket(rate=2.0)
+
+        async def acquire(times):
+            for _ in range(times):
+                await bucket.acquire()
+
+        asyncio.run(acquire(2))
+        sleep.assert_not_called()
+
+        asyncio.run(acquire(1))
+        sleep.assert_awaited_once_with(0.5)
+
+        bucket.update_from_headers({'Retry-After': '10'})
+        asyncio.run(acquire(1))
+        self.assertEqual(sleep.await_args.args, (10.0,))
+
+    @patch('src.utils.ratelimit.time.monotonic', return_value=100.0)
+    def test_rate_follows_quota_headers(self, monotonic):
+        """Test the advertised quota lowers the rate but never raises it past the cap."""
+        bucket = AsyncTokenBucket(rate=5.0)
+
+        bucket.update_from_headers({'X-RateLimit-Remaining': '10', 'X-RateLimit-Reset': '20'})
+        self.assertEqual(bucket.rate, 0.5)
+
+        bucket.update_from_headers({'X-RateLimit-Remaining': '1000', 'X-RateLimit-Reset': '1'})
+        self.assertEqual(bucket.rate, 5.0)
+
+
+    @patch('src.utils.ratelimit.time.sleep')
+    @patch('src.utils.ratelimit.time.monotonic')
+    def test_threaded_bucket_counts_elapsed_time(self, monotonic, sleep):
+        """Test the blocking bucket only waits for the part of the interval not yet elapsed."""
+        monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=1.0)
+        bucket.acquire()
+        sleep.assert_not_called()
+
+        monotonic.return_value = 100.25
+        bucket.acquire()
+        sleep.assert_called_once_with(0.75)
+
+        monotonic.return_value = 103.0
+        bucket.acquire()
+        self.assertEqual(sleep.call_count, 1)
+
+class TestSharedSession(unittest.TestCase):
+    """Test the pooled session used by concurrent scrapers."""
+
+    def test_concurrent_gets_on_one_session(self):
+        """Test threads sharing one session each get their own response back."""
+        class EchoHandler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                body = self.path.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Set-Cookie', f'last={self.path.strip("/")}')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        class EchoServer(ThreadingHTTPServer):
+            # Room for every worker's connect at once, and no waiting on idle keep-alive handlers
+            request_queue_size = 64
+            block_on_close = False
+
+        server = EchoServer(('127.0.0.1', 0), EchoHandler)
+        threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        session = create_session(pool_size=4)
+        self.addCleanup(session.close)
+        base = f'http://127.0.0.1:{server.server_port}'
+        paths = [f'/paper{i}' for i in range(64)]
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            bodies = list(executor.map(lambda path: session.get(base + path, timeout=5).text, paths))
+
+        self.assertEqual(bodies, paths)
+
+
+class TestSafeFilename(unittest.TestCase):
+    """Test filename generation from paper titles."""
+
+    def test_matches_character_filter(self):
+        """Test the regex keeps exactly the alphanumeric, space, '-' and '_' characters."""
+        for title in ["Deep Learning: A Survey?", "Ünïcödé  Títle — 2023 ", "a/b\\c_d-e", "x" * 80,
+                      "".join(map(chr, range(128)))]:
+            with self.subTest(title=title):
+                expected = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
+                self.assertEqual(safe_filename(title), expected.replace(' ', '_')[:50])
+
+
+class TestPaperSource(unittest.TestCase):
+    """Test indexed access to saved paper files."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.papers = [{'title': f'Paper {i}', 'authors': [{'name': f'Author {i}'}], 'score': i / 2} for i in range(45)]
+        self.file_path = Path(self.tmp_dir.name) / 'papers.json'
+        with open(self.file_path, 'w', encoding='utf-8') as f:
+            json.dump({'scraped_at': 'now', 'total_papers': len(self.papers), 'papers': self.papers}, f)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _check_access(self, source):
+        self.assertEqual(len(source), 45)
+        for index in (0, 9, 10, 25, 44, -1, 3):
+            self.assertEqual(source[index], self.papers[index])
+        self.assertEqual(source[18:23], self.papers[18:23])
+        with self.assertRaises(IndexError):
+            source[45]
+
+    def test_eager_small_file(self):
+        """Test small files are loaded up front."""
+        self._check_access(PaperSource(self.file_path))
+
+    @unittest.skipIf(storage.ijson is None, "ijson not installed")
+    def test_streamed_large_file(self):
+        """Test large files are streamed in windows with the same results."""
+        with patch.object(PaperSource, 'EAGER_MAX_BYTES', 0):
+            source = PaperSource(self.file_path, window_size=10)
+        self.assertIsNone(source._papers)
+        self._check_access(source)
+
+
+if __name__ == '__main__':
+    unittest.main()